@@ -5,10 +5,10 @@ from __future__ import annotations
 import json
 import sys
 import tkinter as tk
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from tkinter import messagebox, ttk
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
 from pydantic import BaseModel, ValidationError
 
@@ -31,6 +31,80 @@ class FieldDoc:
     default: Any
     type_name: str
     is_secret: bool
+    # Lowercased once so search filters do not re-lower every field per keystroke.
+    name_key: str = field(init=False, repr=False, compare=False)
+    description_key: str = field(init=False, repr=False, compare=False)
+    # Resolved from the default's type once instead of on every edit.
+    parser: Callable[[str, str], Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.name_key = self.name.lower()
+        self.description_key = self.description.lower()
+        self.parser = _value_parser(self.default)
+
+
+def _parse_optional(name: str, raw: str) -> Any:
+    if raw == "" or raw.lower() == "none":
+        return None
+    return raw
+
+
+def _parse_int(name: str, raw: str) -> int:
+    try:
+        return int(raw)
+    except ValueError as exc:
+        raise ConfigError(f"{name} must be an integer") from exc
+
+
+def _parse_float(name: str, raw: str) -> float:
+    try:
+        return float(raw)
+    except ValueError as exc:
+        raise ConfigError(f"{name} must be a number") from exc
+
+
+def _parse_list(name: str, raw: str) -> Any:
+    if raw.startswith("["):
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError as exc:
+            raise ConfigError(f"{name} must be valid JSON") from exc
+    return [part.strip() for part in raw.split(",") if part.strip()]
+
+
+def _parse_dict(name: str, raw: str) -> Any:
+    if not raw:
+        return {}
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError as exc:
+        raise ConfigError(f"{name} must be valid JSON") from exc
+
+
+def _parse_bool(name: str, raw: str) -> bool:
+    return raw.lower() in {"true", "1", "yes"}
+
+
+def _parse_text(name: str, raw: str) -> str:
+    return raw
+
+
+def _value_parser(default: Any) -> Callable[[str, str], Any]:
+    """Return the parser for fields whose default is *default*."""
+
+    if default is None:
+        return _parse_optional
+    if isinstance(default, bool):
+        return _parse_bool
+    if isinstance(default, int):
+        return _parse_int
+    if isinstance(default, float):
+        return _parse_float
+    if isinstance(default, list):
+        return _parse_list
+    if isinstance(default, dict):
+        return _parse_dict
+    return _parse_text
 
 
 @dataclass(frozen=True)
@@ -113,6 +187,7 @@ class ConfigEditor:
         self._choice_reverse: Dict[str, Dict[str, str]] = {}
         self._field_groups: Dict[str, str] = {}
         self._group_descriptions: Dict[str, str] = {}
+        self._pending_idle: set[Callable[[], None]] = set()
         self._root = tk.Tk()
         self._root.title("Noticiencias Configuration")
         self._status = tk.StringVar()
@@ -195,7 +270,9 @@ class ConfigEditor:
         ttk.Label(toolbar, text="Filter:").grid(row=0, column=0, padx=(0, 6))
         search_entry = ttk.Entry(toolbar, textvariable=self._search_var)
         search_entry.grid(row=0, column=1, sticky="ew")
-        search_entry.bind("<KeyRelease>", lambda _event: self._apply_filter())
+        search_entry.bind(
+            "<KeyRelease>", lambda _event: self._schedule_idle(self._apply_filter)
+        )
 
         ttk.Button(toolbar, text="Reload", command=self._reload).grid(
             row=0, column=2, padx=6
@@ -312,36 +389,50 @@ class ConfigEditor:
         scrollbar.grid(row=1, column=2, sticky="ns")
         tree.configure(yscrollcommand=scrollbar.set)
 
+        rows: List[Tuple[Tuple[str, ...], Tuple[str, ...]]] = []
+        for name in sorted(self._field_docs):
+            doc = self._field_docs[name]
+            group_label = self._field_groups.get(name, "Other")
+            haystacks = (doc.name_key, doc.description_key, group_label.lower())
+            values = (
+                doc.name,
+                doc.type_name,
+                self._format_display(doc.default),
+                group_label,
+                doc.description,
+            )
+            rows.append((haystacks, values))
+
         def refresh_tree(*_args: object) -> None:
             needle = search.get().strip().lower()
             tree.delete(*tree.get_children())
-            for name in sorted(self._field_docs):
-                doc = self._field_docs[name]
-                group_label = self._field_groups.get(name, "Other")
-                haystacks = (
-                    doc.name.lower(),
-                    doc.description.lower(),
-                    group_label.lower(),
-                )
+            for haystacks, values in rows:
                 if needle and not any(needle in haystack for haystack in haystacks):
                     continue
-                tree.insert(
-                    "",
-                    "end",
-                    values=(
-                        doc.name,
-                        doc.type_name,
-                        self._format_display(doc.default),
-                        group_label,
-                        doc.description,
-                    ),
-                    iid=doc.name,
-                    text=doc.name,
-                )
+                tree.insert("", "end", values=values, iid=values[0], text=values[0])
 
-        search_entry.bind("<KeyRelease>", refresh_tree)
+        search_entry.bind(
+            "<KeyRelease>", lambda _event: self._schedule_idle(refresh_tree)
+        )
         refresh_tree()
 
+    def _schedule_idle(self, callback: Callable[[], None]) -> None:
+        """Run *callback* once Tk is idle, coalescing repeated requests.
+
+        A burst of keystrokes then triggers a single refresh instead of one
+        per key.
+        """
+
+        if callback in self._pending_idle:
+            return
+        self._pending_idle.add(callback)
+
+        def run() -> None:
+            self._pending_idle.discard(callback)
+            callback()
+
+        self._root.after_idle(run)
+
     def _create_field_row(self, parent: ttk.Frame, index: int, name: str) -> None:
         doc = self._field_docs[name]
         value = self._resolve_value(name)
@@ -438,30 +529,34 @@ class ConfigEditor:
         needle = self._search_var.get().strip().lower()
         for name, widget in self._widgets.items():
             frame = widget.master  # type: ignore[assignment]
+            doc = self._field_docs[name]
             visible = (
-                not needle
-                or needle in name.lower()
-                or needle in self._field_docs[name].description.lower()
+                not needle or needle in doc.name_key or needle in doc.description_key
             )
-            frame.grid_remove()
             if visible:
                 frame.grid()
+            else:
+                frame.grid_remove()
 
     def _on_change(self, name: str) -> None:
+        # Only the edited field can have changed, so update it in place rather
+        # than re-dumping the whole config and re-parsing every widget.
         try:
-            self._data = self._collect_values()
+            self._assign(self._data, name, self._read_variable(name))
             self._status.set("")
         except ConfigError as exc:
             self._status.set(str(exc))
 
+    def _read_variable(self, name: str) -> Any:
+        var = self._variables[name]
+        if isinstance(var, tk.BooleanVar):
+            return bool(var.get())
+        return self._parse_value(name, var.get())
+
     def _collect_values(self) -> Dict[str, Any]:
         updated = self._config.model_dump(mode="python")
-        for name, var in self._variables.items():
-            if isinstance(var, tk.BooleanVar):
-                value = bool(var.get())
-            else:
-                value = self._parse_value(name, var.get())
-            self._assign(updated, name, value)
+        for name in self._variables:
+            self._assign(updated, name, self._read_variable(name))
         return updated
 
     def _parse_value(self, name: str, raw: str) -> Any:
@@ -471,38 +566,7 @@ class ConfigEditor:
             if not raw:
                 return ""
             return mapping.get(raw, raw)
-        default = self._field_docs[name].default
-        if raw == "" and default is None:
-            return None
-        if raw.lower() == "none" and default is None:
-            return None
-        if isinstance(default, int) and not isinstance(default, bool):
-            try:
-                return int(raw)
-            except ValueError as exc:
-                raise ConfigError(f"{name} must be an integer") from exc
-        if isinstance(default, float):
-            try:
-                return float(raw)
-            except ValueError as exc:
-                raise ConfigError(f"{name} must be a number") from exc
-        if isinstance(default, list):
-            if raw.startswith("["):
-                try:
-                    return json.loads(raw)
-                except json.JSONDecodeError as exc:
-                    raise ConfigError(f"{name} must be valid JSON") from exc
-            return [part.strip() for part in raw.split(",") if part.strip()]
-        if isinstance(default, dict):
-            if not raw:
-                return {}
-            try:
-                return json.loads(raw)
-            except json.JSONDecodeError as exc:
-                raise ConfigError(f"{name} must be valid JSON") from exc
-        if isinstance(default, bool):
-            return raw.lower() in {"true", "1", "yes"}
-        return raw
+        return self._field_docs[name].parser(name, raw)
 
     def _assign(self, target: Dict[str, Any], path: str, value: Any) -> None:
         parts = path.split(".")
@@ -6,6 +6,7 @@ import hashlib
 import random
 import time
 import urllib.robotparser as robotparser
+from contextlib import AsyncExitStack
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 from urllib.parse import urlparse
@@ -22,9 +23,30 @@ if TYPE_CHECKING:  # pragma: no cover - typing aid
 from config.settings import COLLECTION_CONFIG, RATE_LIMITING_CONFIG, ROBOTS_CONFIG
 
 
+def build_async_client() -> httpx.AsyncClient:
+    """Crea el cliente HTTP asíncrono con las cabeceras del colector."""
+
+    headers = {
+        "User-Agent": COLLECTION_CONFIG["user_agent"],
+        "Accept": "application/rss+xml, application/atom+xml, application/xml, text/xml",
+        "Accept-Language": "en-US,en;q=0.9,es;q=0.8",
+        "Accept-Encoding": "gzip, deflate",
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+    }
+    return httpx.AsyncClient(headers=headers, follow_redirects=True)
+
+
 class AsyncRSSCollector(RSSCollector):
-    def __init__(self, logger_factory: Optional["NewsCollectorLogger"] = None) -> None:
+    def __init__(
+        self,
+        logger_factory: Optional["NewsCollectorLogger"] = None,
+        *,
+        max_concurrent_requests: Optional[int] = None,
+    ) -> None:
         super().__init__(logger_factory=logger_factory)
+        # Límite de fuentes simultáneas; None usa COLLECTION_CONFIG en cada lote
+        self.max_concurrent_requests = max_concurrent_requests
         # Estado asíncrono
         self._domain_locks: Dict[str, asyncio.Lock] = {}
         self._domain_next_time: Dict[str, float] = {}
@@ -411,7 +433,14 @@ class AsyncRSSCollector(RSSCollector):
         *,
         session_id: Optional[str] = None,
         trace_id: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> Dict[str, Any]:
+        """Recolecta todas las fuentes de forma concurrente.
+
+        ``client`` permite reutilizar un ``httpx.AsyncClient`` (y su pool de
+        conexiones) entre ejecuciones; si se omite se crea uno y se cierra al
+        terminar.
+        """
         self._set_runtime_context(session_id=session_id, trace_id=trace_id)
         self.start_time = datetime.now(timezone.utc)
         self._reset_stats()
@@ -423,19 +452,15 @@ class AsyncRSSCollector(RSSCollector):
             details={"sources": len(sources_config)},
         )
 
-        headers = {
-            "User-Agent": COLLECTION_CONFIG["user_agent"],
-            "Accept": "application/rss+xml, application/atom+xml, application/xml, text/xml",
-            "Accept-Language": "en-US,en;q=0.9,es;q=0.8",
-            "Accept-Encoding": "gzip, deflate",
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        }
-
         source_results: Dict[str, Dict[str, Any]] = {}
-        sem = asyncio.Semaphore(COLLECTION_CONFIG["max_concurrent_requests"])
-
-        async with httpx.AsyncClient(headers=headers, follow_redirects=True) as client:
+        limit = self.max_concurrent_requests
+        if limit is None:
+            limit = COLLECTION_CONFIG["max_concurrent_requests"]
+        sem = asyncio.Semaphore(limit)
+
+        async with AsyncExitStack() as stack:
+            if client is None:
+                client = await stack.enter_async_context(build_async_client())
 
             async def run_one(sid: str, cfg: Dict[str, Any]):
                 try:
@@ -152,7 +152,7 @@ class ConfigurableNLPStack:
         nlp = self._get_spacy_model(language)
         if nlp is None:
             return ()
-        seen: "OrderedDict[str, None]" = OrderedDict()
+        seen: dict[str, None] = {}
         for text in texts:
             if not text:
                 continue
@@ -199,7 +199,7 @@ class ConfigurableNLPStack:
             if index >= 0:
                 matches.append((index, alias))
         matches.sort(key=lambda item: item[0])
-        ordered: "OrderedDict[str, None]" = OrderedDict()
+        ordered: dict[str, None] = {}
         for _, alias in matches:
             if alias:
                 ordered.setdefault(alias, None)
@@ -240,7 +240,7 @@ class ConfigurableNLPStack:
         topics_config = self._model_config.get("topics", {})
         if not isinstance(topics_config, Mapping) or not topics_config:
             return (self._default_topic,)
-        detected: "OrderedDict[str, None]" = OrderedDict()
+        detected: dict[str, None] = {}
         for topic, topic_config in topics_config.items():
             if not isinstance(topic_config, Mapping):
                 continue
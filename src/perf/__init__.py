@@ -4,6 +4,7 @@ from .load_replay import (
     CollectorReplaySession,
     MemoryFeedStore,
     ReplayEvent,
+    build_source_config,
     load_replay_fixture,
 )
 
@@ -11,5 +12,6 @@ __all__ = [
     "CollectorReplaySession",
     "MemoryFeedStore",
     "ReplayEvent",
+    "build_source_config",
     "load_replay_fixture",
 ]
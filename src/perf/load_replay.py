@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import time
+from array import array
 from collections import defaultdict, deque
 from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
@@ -12,10 +13,28 @@ from datetime import datetime, timezone
 from itertools import count
 from pathlib import Path
 from types import MethodType
-from typing import Any, Deque, Dict, Iterator, List, MutableMapping, Optional, Sequence
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+)
 
 import feedparser
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
+# Both decoders accept bytes, so fixture lines never need a str round-trip.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 @dataclass(frozen=True)
 class ReplayArticle:
@@ -151,20 +170,16 @@ class CollectorReplaySession:
         self._token_map: dict[str, ReplayEvent] = {}
         self._token_counter = count()
         self.requests: list[dict[str, Any]] = []
+        # Column views of ``requests`` so summaries can hand them straight to
+        # numpy instead of walking the per-request dicts.
+        self.latencies_ms: array[float] = array("d")
+        self.status_codes: array[int] = array("i")
 
     # ------------------------------------------------------------------ utilities --
     def build_source_config(self) -> Dict[str, Dict[str, Any]]:
         """Construct collector-ready source configuration mapping."""
 
-        config: Dict[str, Dict[str, Any]] = {}
-        for source_id, template in self._sources.items():
-            config[source_id] = {
-                "name": template.feed_title,
-                "url": template.url,
-                "category": template.category,
-                "credibility_score": template.credibility_score,
-            }
-        return config
+        return _source_config(self._sources.values())
 
     def _pop_event(self, source_id: str) -> ReplayEvent:
         try:
@@ -356,6 +371,8 @@ class CollectorReplaySession:
                 "status_code": event.status_code,
             }
         )
+        self.latencies_ms.append(event.latency_ms)
+        self.status_codes.append(event.status_code)
 
     @contextmanager
     def patch_collector(
@@ -377,16 +394,27 @@ class CollectorReplaySession:
             delattr(collector, "_replay_session")
 
 
+def build_source_config(events: Sequence[ReplayEvent]) -> Dict[str, Dict[str, Any]]:
+    """Construct the source configuration for *events* without a session.
+
+    Each source is described by its first event, as in
+    :meth:`CollectorReplaySession.build_source_config`.
+    """
+
+    templates: Dict[str, ReplayEvent] = {}
+    for event in events:
+        templates.setdefault(event.source_id, event)
+    return _source_config(templates.values())
+
+
 def load_replay_fixture(path: str | Path) -> List[ReplayEvent]:
     """Load replay events stored as JSON Lines."""
 
     source = Path(path)
-    events: List[ReplayEvent] = []
-    with source.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            payload = json.loads(line)
-            events.append(ReplayEvent.from_mapping(payload))
-    return events
+    return [
+        ReplayEvent.from_mapping(_json_loads(line))
+        for line in source.read_bytes().splitlines()
+    ]
 
 
 # --------------------------------------------------------------------------- helpers
@@ -405,6 +433,18 @@ def _patch_method(obj: Any, name: str, func: Any) -> contextmanager[None]:
     return _inner()
 
 
+def _source_config(templates: Iterable[ReplayEvent]) -> Dict[str, Dict[str, Any]]:
+    return {
+        template.source_id: {
+            "name": template.feed_title,
+            "url": template.url,
+            "category": template.category,
+            "credibility_score": template.credibility_score,
+        }
+        for template in templates
+    }
+
+
 def _noop_rate_limit(self: Any, *args: Any, **kwargs: Any) -> None:
     return None
 
@@ -427,5 +467,6 @@ __all__ = [
     "CollectorReplaySession",
     "MemoryFeedStore",
     "ReplayEvent",
+    "build_source_config",
     "load_replay_fixture",
 ]
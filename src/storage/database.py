@@ -20,7 +20,7 @@ from sqlalchemy import create_engine, desc, func, inspect, text
 from sqlalchemy.engine import URL
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, load_only, sessionmaker
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import QueuePool, StaticPool
 
 from src.utils.pydantic_compat import get_pydantic_module
 
@@ -103,7 +103,17 @@ class DatabaseManager:
         todos los sistemas estén operativos.
         """
         try:
-            if self.config["type"] == "sqlite":
+            if self.config["type"] == "sqlite" and self.config.get("memory"):
+                # SQLite en memoria: una única conexión compartida (StaticPool)
+                # para que todas las sesiones vean las mismas tablas.
+                self.engine = create_engine(
+                    "sqlite://",
+                    echo=False,
+                    connect_args={"check_same_thread": False},
+                    poolclass=StaticPool,
+                )
+
+            elif self.config["type"] == "sqlite":
                 # Para SQLite, creamos el archivo si no existe
                 db_path = self.config["path"]
                 db_path.parent.mkdir(parents=True, exist_ok=True)
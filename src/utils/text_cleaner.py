@@ -3,15 +3,15 @@ from __future__ import annotations
 import html as _html
 import re
 import unicodedata
-from typing import Iterable
 
 from bs4 import BeautifulSoup
 
-_BOILERPLATE_PATTERNS: Iterable[re.Pattern] = [
-    re.compile(r"^\s*read more\s*$", re.I),
-    re.compile(r"^\s*continue reading\s*$", re.I),
-    re.compile(r"^\s*the post .* appeared first on .*", re.I),
-]
+# Single alternation so each text node is matched once instead of per phrase.
+_BOILERPLATE_RE = re.compile(
+    r"^\s*(?:read more\s*$|continue reading\s*$|the post .* appeared first on .*)",
+    re.I,
+)
+_STRIPPED_TAGS = ["script", "style", "noscript"]
 
 
 def normalize_text(text: str) -> str:
@@ -31,12 +31,13 @@ def clean_html(html: str) -> str:
     if not html:
         return ""
     soup = BeautifulSoup(html, "html.parser")
-    for tag in soup(["script", "style", "noscript"]):
+    for tag in soup(_STRIPPED_TAGS):
         tag.decompose()
     # Remove common boilerplate nodes by text
-    for el in list(soup.find_all(text=True)):
-        txt = normalize_text(str(el))
-        if any(p.search(txt) for p in _BOILERPLATE_PATTERNS):
+    for el in list(soup.find_all(string=True)):
+        if el.isspace():
+            continue
+        if _BOILERPLATE_RE.search(normalize_text(str(el))):
             try:
                 el.extract()
             except Exception:
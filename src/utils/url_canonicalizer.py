@@ -17,8 +17,9 @@ from __future__ import annotations
 
 import posixpath
 import re
-from functools import lru_cache
-from typing import Callable, Iterable, Tuple
+from collections import namedtuple
+from threading import Lock
+from typing import Callable, Dict, Iterable, Tuple
 from urllib.parse import parse_qsl, quote, unquote, urlparse, urlunparse
 
 TRACKING_PARAM_PREFIXES: Tuple[str, ...] = (
@@ -56,6 +57,12 @@ AMP_PATH_PATTERNS: Tuple[re.Pattern, ...] = (
     re.compile(r"\.amp$", re.IGNORECASE),
 )
 
+# Hot-path lookups: frozen sets for exact keys and one regex per rewrite.
+_TRACKING_PARAM_SET = frozenset(TRACKING_PARAMS)
+_BENIGN_EMPTY_SET = frozenset(BENIGN_EMPTY_PARAMS)
+_AMP_PATH_RE = re.compile(r"(?:/amp/?|\.amp)$", re.IGNORECASE)
+_DOUBLE_SLASH_RE = re.compile(r"//+")
+
 
 SAFE_PATH_CHARS = "@:$&'()*+,;=-._~!%/"
 
@@ -72,7 +79,7 @@ def _normalize_path(path: str) -> str:
     if not path:
         return "/"
     decoded = unquote(path)
-    decoded = re.sub(r"//+", "/", decoded)
+    decoded = _DOUBLE_SLASH_RE.sub("/", decoded)
     normalized = posixpath.normpath(decoded)
     if decoded.endswith("/") and not normalized.endswith("/"):
         normalized += "/"
@@ -85,11 +92,11 @@ def _filter_query_params(pairs: Iterable[Tuple[str, str]]) -> Iterable[Tuple[str
     seen = set()
     for key, value in pairs:
         key_lower = key.lower()
-        if key_lower in BENIGN_EMPTY_PARAMS:
+        if key_lower in _BENIGN_EMPTY_SET:
             continue
-        if any(key_lower.startswith(prefix) for prefix in TRACKING_PARAM_PREFIXES):
+        if key_lower.startswith(TRACKING_PARAM_PREFIXES):
             continue
-        if key_lower in TRACKING_PARAMS:
+        if key_lower in _TRACKING_PARAM_SET:
             continue
         if key_lower == "amp" and value in ("1", "true", "amp"):
             continue
@@ -102,11 +109,48 @@ def _filter_query_params(pairs: Iterable[Tuple[str, str]]) -> Iterable[Tuple[str
         yield pair
 
 
+# Shape of a URL that may already be canonical: https, lower-case host without
+# port, a path free of escapes/params, and plain ``key=value`` query pairs.
+_ALREADY_CANONICAL_RE = re.compile(
+    r"https://([a-z0-9.-]+)(/[A-Za-z0-9\-._~!$&'()*+,=:@/]*)"
+    r"(?:\?([a-z0-9_.~-]+=[A-Za-z0-9_.~-]+(?:&[a-z0-9_.~-]+=[A-Za-z0-9_.~-]+)*))?"
+)
+
+
+def _is_already_canonical(url: str) -> bool:
+    """Return True when the full rule set would return ``url`` unchanged."""
+
+    match = _ALREADY_CANONICAL_RE.fullmatch(url)
+    if match is None:
+        return False
+    host, path, query = match.groups()
+    if host.startswith(MOBILE_HOST_PREFIXES):
+        return False
+    if "//" in path or "/." in path or _AMP_PATH_RE.search(path):
+        return False
+    if query is None:
+        return True
+    previous: Tuple[str, str] = ("", "")
+    for item in query.split("&"):
+        key, _, value = item.partition("=")
+        if key.startswith(TRACKING_PARAM_PREFIXES) or key in _TRACKING_PARAM_SET:
+            return False
+        pair = (key, value)
+        # Strictly increasing pairs are both sorted and free of duplicates.
+        if pair <= previous:
+            return False
+        previous = pair
+    return True
+
+
 def _canonicalize_url_impl(url: str) -> str:
     """Canonicalize a URL string as per the rule set."""
     if not url:
         return url
 
+    if _is_already_canonical(url):
+        return url
+
     url = url.strip()
     if not url:
         return url
@@ -132,9 +176,7 @@ def _canonicalize_url_impl(url: str) -> str:
     host = _clean_host(netloc)
 
     # Normalize path, stripping AMP markers
-    normalized_path = _normalize_path(path)
-    for pattern in AMP_PATH_PATTERNS:
-        normalized_path = pattern.sub("/", normalized_path)
+    normalized_path = _AMP_PATH_RE.sub("/", _normalize_path(path))
     if not normalized_path:
         normalized_path = "/"
 
@@ -170,9 +212,54 @@ def _canonicalize_url_impl(url: str) -> str:
 
 _CACHE_SIZE = -1
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+def _bounded_cache(func: Callable[[str], str], maxsize: int) -> Callable[[str], str]:
+    """Memoize ``func`` in a plain dict with FIFO eviction.
+
+    Hits cost a single ``dict.get``; unlike :func:`functools.lru_cache` there
+    is no recency bookkeeping on every call. Inserts, evictions and clears
+    share one lock so concurrent misses never evict the same key twice.
+    Exposes ``cache_info`` and ``cache_clear`` with the same shape as
+    ``lru_cache``.
+    """
+
+    cache: Dict[str, str] = {}
+    stats = [0, 0]  # hits, misses
+    cache_get = cache.get
+    lock = Lock()
+
+    def wrapper(url: str) -> str:
+        result = cache_get(url)
+        if result is not None:
+            stats[0] += 1
+            return result
+        stats[1] += 1
+        result = func(url)
+        with lock:
+            if url not in cache and len(cache) >= maxsize:
+                del cache[next(iter(cache))]
+            cache[url] = result
+        return result
+
+    def cache_info() -> CacheInfo:
+        return CacheInfo(stats[0], stats[1], maxsize, len(cache))
+
+    def cache_clear() -> None:
+        with lock:
+            cache.clear()
+            stats[0] = stats[1] = 0
+
+    wrapper.cache_info = cache_info  # type: ignore[attr-defined]
+    wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+    wrapper.__wrapped__ = func  # type: ignore[attr-defined]
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
 
 def configure_canonicalization_cache(size: int) -> None:
-    """Configure the LRU cache used by :func:`canonicalize_url`."""
+    """Configure the bounded cache used by :func:`canonicalize_url`."""
 
     global canonicalize_url, _CACHE_SIZE
     if size == _CACHE_SIZE:
@@ -180,7 +267,7 @@ def configure_canonicalization_cache(size: int) -> None:
     if size <= 0:
         canonicalize_url = _canonicalize_url_impl
     else:
-        canonicalize_url = lru_cache(maxsize=size)(_canonicalize_url_impl)
+        canonicalize_url = _bounded_cache(_canonicalize_url_impl, size)
     _CACHE_SIZE = size
 
 
@@ -0,0 +1,32 @@
+"""Shared pytest fixtures for the test suite."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from hypothesis import Phase, settings
+
+from tools.scan_placeholders import load_patterns
+
+# ``ci-fast`` replays the example database before a small generation budget;
+# ``nightly`` widens the search. Select with HYPOTHESIS_PROFILE.
+settings.register_profile(
+    "ci-fast",
+    max_examples=10,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.shrink],
+)
+settings.register_profile("nightly", max_examples=200)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
+
+PLACEHOLDER_PATTERN_PATH = (
+    Path(__file__).resolve().parents[1] / "tools" / "placeholder_patterns.yml"
+)
+
+
+@pytest.fixture(scope="session")
+def patterns():
+    """Parse and compile the placeholder patterns once per test process."""
+
+    return load_patterns(PLACEHOLDER_PATTERN_PATH)
@@ -181,3 +181,27 @@ def test_editor_save_rejects_invalid_numeric_input(
     assert "Configuration validation failed" in message
     assert "database.connect_timeout" in message
     assert editor._status.get().startswith("Configuration validation failed")
+
+
+def test_editor_change_updates_only_edited_field(
+    tmp_path: Path, editor_factory: Callable[[Config], ConfigEditor]
+) -> None:
+    """A field edit is reflected in the editor data without touching other fields."""
+
+    config_path = tmp_path / "config.toml"
+    initial_config = _write_config(config_path, connect_timeout=12, async_enabled=False)
+    editor = editor_factory(initial_config)
+
+    editor._variables["database.connect_timeout"].set("30")
+    editor._variables["collection.async_enabled"].set(True)
+    editor._on_change("database.connect_timeout")
+
+    assert editor._resolve_value("database.connect_timeout") == 30
+    assert editor._resolve_value("collection.async_enabled") is False
+    assert editor._status.get() == ""
+
+    editor._variables["database.connect_timeout"].set("soon")
+    editor._on_change("database.connect_timeout")
+
+    assert editor._resolve_value("database.connect_timeout") == 30
+    assert editor._status.get() == "database.connect_timeout must be an integer"
@@ -4,27 +4,40 @@ from __future__ import annotations
 
 import dataclasses
 import datetime as dt
+import io
+import json
+import pickle
 from pathlib import Path
 from typing import List
 
 import pytest
 
 from tools.placeholder_audit import (
+    _dump_json,
     AgeThresholds,
     AuditConfig,
     AuditReport,
     DiffFile,
     DiffLine,
+    GitCatFileBatch,
     PlaceholderRecord,
+    build_full_scan_targets,
     build_pr_comment,
+    blame_file,
     build_sarif,
     classify_context,
+    compute_delta,
+    compute_age_days,
     detect_placeholders,
     evaluate_placeholder,
+    format_table,
+    match_any,
     parse_attributes,
     parse_diff,
+    read_base_file,
     scan_files,
     should_fail,
+    summarize,
     track_fences,
 )
 
@@ -64,6 +77,15 @@ def test_classify_context_prefers_tests_over_prod(audit_config: AuditConfig) ->
     assert classify_context(path, audit_config) == "tests"
 
 
+def test_match_any_covers_root_files_and_basenames() -> None:
+    patterns = ("**/*.py", "**/generated/**")
+    assert match_any(Path("setup.py"), patterns)
+    assert match_any(Path("src/pkg/module.py"), patterns)
+    assert match_any(Path("src/generated/schema.json"), patterns)
+    assert not match_any(Path("docs/index.md"), patterns)
+    assert not match_any(Path("docs/index.md"), ())
+
+
 def test_track_fences_identifies_lines() -> None:
     content = """```\nTBD[issue=#1]: sample\n```\nOutside"""
     fence_lines = track_fences(content)
@@ -71,6 +93,13 @@ def test_track_fences_identifies_lines() -> None:
     assert 3 not in fence_lines
 
 
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\x0c"])
+def test_track_fences_matches_nested_and_unclosed_fences(newline: str) -> None:
+    lines = ["intro", "  ```py", "~~~", "code", "```", "x ```", "  ~~~", "tail", "end"]
+    content = newline.join(lines)
+    assert track_fences(content) == {4, 6, 8, 9}
+
+
 def test_evaluate_placeholder_flags_missing_fields(audit_config: AuditConfig) -> None:
     severity, score, reasons, _, expired = evaluate_placeholder(
         marker="TODO",
@@ -107,6 +136,27 @@ def test_evaluate_placeholder_warns_due_soon(audit_config: AuditConfig) -> None:
     assert not expired
 
 
+def test_evaluate_placeholder_judges_due_dates_against_given_day(
+    audit_config: AuditConfig,
+) -> None:
+    common = dict(
+        marker="FIXME",
+        attributes={"owner": "@bob", "due": "2030-01-10", "issue": "#200"},
+        text="follow up",
+        context="tests",
+        config=audit_config,
+        age_days=5,
+        inside_fence=False,
+    )
+    *_, expired = evaluate_placeholder(**common, today=dt.date(2030, 1, 11))
+    assert expired
+    _, _, reasons, _, expired = evaluate_placeholder(
+        **common, today=dt.date(2030, 1, 5)
+    )
+    assert not expired
+    assert "due within warn window" in reasons
+
+
 def test_detect_placeholders_skips_markdown_fenced_code(
     audit_config: AuditConfig,
 ) -> None:
@@ -128,6 +178,35 @@ def test_detect_placeholders_skips_markdown_fenced_code(
     assert all(f.line_number != 6 for f in findings)
 
 
+def test_detect_placeholders_reports_splitlines_numbers(
+    monkeypatch: pytest.MonkeyPatch, audit_config: AuditConfig
+) -> None:
+    monkeypatch.setattr(
+        "tools.placeholder_audit.compute_age_days", lambda *_args, **_kwargs: 0
+    )
+    content = (
+        "first\r\n"
+        "# TODO[owner=@a; issue=#1]: one TODO[owner=@b]: two\r\n"
+        "plain\r\n"
+        "# FIXME[owner=@c; due=2099-01-01; issue=#2]: three"
+    )
+    for text in (content, content.replace("plain", "page\x0cbreak")):
+        findings = detect_placeholders(
+            path=Path("src/module.py"),
+            content=text,
+            new_lines={idx: "+" for idx in range(1, 6)},
+            context="prod_code",
+            config=audit_config,
+            inside_fence_lines=set(),
+        )
+        expected_fixme_line = len(text.splitlines())
+        assert [(f.line_number, f.marker) for f in findings] == [
+            (2, "TODO"),
+            (expected_fixme_line, "FIXME"),
+        ]
+        assert findings[1].text == "three"
+
+
 def test_scan_files_flags_net_new_high(
     monkeypatch: pytest.MonkeyPatch,
     audit_config: AuditConfig,
@@ -170,6 +249,31 @@ def test_scan_files_flags_net_new_high(
     assert report.base_high_count == 0
 
 
+def test_scan_files_parallel_matches_serial(
+    monkeypatch: pytest.MonkeyPatch, audit_config: AuditConfig, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(
+        "tools.placeholder_audit.compute_age_days", lambda *_args, **_kwargs: 0
+    )
+    diff_files = [
+        DiffFile(
+            path=tmp_path / f"module_{idx}.py",
+            content=f"value = {idx}\n# TODO[owner=@a{idx}]: item {idx}\n",
+            full_scan=True,
+            line_count=2,
+        )
+        for idx in range(6)
+    ]
+    serial = scan_files(diff_files, audit_config, "origin/main")
+
+    monkeypatch.setattr("tools.placeholder_audit._PARALLEL_SCAN_MIN_FILES", 2)
+    monkeypatch.setattr("tools.placeholder_audit.os.cpu_count", lambda: 2)
+    parallel = scan_files(diff_files, audit_config, "origin/main")
+
+    assert [f.text for f in parallel.findings] == [f"item {idx}" for idx in range(6)]
+    assert parallel == serial
+
+
 def test_build_sarif_levels_map_severities() -> None:
     finding_high = PlaceholderRecord(
         marker="TODO",
@@ -198,6 +302,40 @@ def test_build_sarif_levels_map_severities() -> None:
     sarif = build_sarif([finding_high, finding_low])
     levels = {result["level"] for result in sarif["runs"][0]["results"]}
     assert levels == {"error", "note"}
+    messages = [result["message"]["text"] for result in sarif["runs"][0]["results"]]
+    assert messages == ["missing due", "docs TBD"]
+    uris = [
+        result["locations"][0]["physicalLocation"]["artifactLocation"]["uri"]
+        for result in sarif["runs"][0]["results"]
+    ]
+    assert uris == ["src/app.py", "docs/page.md"]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dump_json_round_trips_sarif(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr("tools.placeholder_audit._orjson", None)
+    finding = PlaceholderRecord(
+        marker="TODO",
+        attributes={"owner": "@a"},
+        text="añadir reintentos",
+        file_path=Path("src/app.py"),
+        line_number=3,
+        context="prod_code",
+        inside_fence=False,
+        severity="MED",
+        score=0.75,
+        reasons=[],
+        suggested_fix="Add due",
+        expired=False,
+        is_added_or_modified=True,
+    )
+    sarif = build_sarif([finding])
+    assert json.loads(_dump_json(sarif)) == sarif
 
 
 def test_pr_comment_limits_rows() -> None:
@@ -268,3 +406,279 @@ def test_parse_diff_extracts_new_and_old_lines(monkeypatch: pytest.MonkeyPatch)
     files = parse_diff("main", 3)
     assert files[0].new_line_numbers()[2] == "+"
     assert files[0].old_line_numbers()[1] == " "
+    assert files[0].old_line_numbers() == {1: " ", 2: " "}
+    assert files[0].lines == []
+
+
+def test_diff_file_indexes_hand_built_lines() -> None:
+    diff = DiffFile(
+        path=Path("src/app.py"),
+        lines=[
+            DiffLine(old_number=None, new_number=None, symbol="@"),
+            DiffLine(old_number=4, new_number=None, symbol="-"),
+            DiffLine(old_number=5, new_number=4, symbol=" "),
+        ],
+    )
+    assert diff.new_line_numbers() == {4: " "}
+    assert diff.old_line_numbers() == {4: "-", 5: " "}
+
+    diff.lines.append(DiffLine(old_number=None, new_number=5, symbol="+"))
+    diff.path = Path("src/main.py")
+    assert diff.new_line_numbers() == {4: " ", 5: "+"}
+    assert diff.posix == "src/main.py"
+
+
+def test_compute_age_days_blames_each_file_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = dt.datetime.now(tz=dt.timezone.utc)
+    old = int((now - dt.timedelta(days=40)).timestamp())
+    new = int((now - dt.timedelta(days=2)).timestamp())
+    sha_a, sha_b = "a" * 40, "b" * 40
+    porcelain = "\n".join(
+        [
+            f"{sha_a} 1 1 2",
+            "author alice",
+            f"author-time {old}",
+            "summary first commit",
+            "filename src/app.py",
+            f"{sha_b} 5 3 1",
+            f"author-time {new}",
+            "summary 0000 1 2 3",
+            "filename src/app.py",
+            f"{sha_a} 9 4 1",
+            "filename src/app.py",
+        ]
+    )
+    calls: List[List[str]] = []
+
+    def fake_run_git(args, cwd=None):
+        calls.append(list(args))
+        return porcelain
+
+    monkeypatch.setattr("tools.placeholder_audit.run_git", fake_run_git)
+    assert blame_file(Path("src/app.py")) == {1: 40, 2: 40, 3: 2, 4: 40}
+
+    calls.clear()
+    cache: dict = {}
+    ages = [compute_age_days(Path("src/app.py"), line, cache) for line in (1, 3, 9)]
+    assert ages == [40, 2, None]
+    assert len(calls) == 1
+
+
+def test_build_full_scan_targets_reads_each_text_file_once(
+    monkeypatch: pytest.MonkeyPatch, audit_config: AuditConfig, tmp_path: Path
+) -> None:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("a = 1\n# TODO: x\n", encoding="utf-8")
+    (tmp_path / "src" / "blob.py").write_bytes(b"\x00\x01binary")
+    (tmp_path / "src" / "latin1.py").write_bytes(b"# caf\xe9\n")
+    (tmp_path / "my docs.md").write_text("# Title", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        "tools.placeholder_audit.run_git",
+        lambda *_args, **_kwargs: (
+            "src/app.py\0src/blob.py\0src/latin1.py\0my docs.md\0gone.py\0"
+        ),
+    )
+
+    targets = build_full_scan_targets(audit_config)
+
+    # Like the text-mode read it replaces, only files that are not UTF-8
+    # (and missing ones) are left out; NUL bytes alone do not exclude a file.
+    assert [target.path.as_posix() for target in targets] == [
+        "src/app.py",
+        "src/blob.py",
+        "my docs.md",
+    ]
+    assert targets[0].content == "a = 1\n# TODO: x\n"
+    new_lines = targets[0].new_line_numbers()
+    assert targets[0].lines == []
+    assert sorted(new_lines) == [1, 2]
+    assert new_lines.get(2) == "+"
+    assert new_lines.get(3) is None
+    assert targets[0].old_line_numbers() == {}
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [b"", b"a\n", b"a\nb", b"a\r\nb\r\n", b"a\rb\rc", b"a\x0cb\n", b"a\n\n"],
+)
+def test_build_full_scan_targets_counts_lines_like_splitlines(
+    monkeypatch: pytest.MonkeyPatch,
+    audit_config: AuditConfig,
+    tmp_path: Path,
+    payload: bytes,
+) -> None:
+    (tmp_path / "app.py").write_bytes(payload)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        "tools.placeholder_audit.run_git", lambda *_args, **_kwargs: "app.py\0"
+    )
+    (target,) = build_full_scan_targets(audit_config)
+    assert target.line_count == len(payload.decode("utf-8").splitlines())
+
+
+def test_audit_config_load_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    pytest.importorskip("yaml")
+    config_path = tmp_path / "audit.yaml"
+    config_path.write_text(
+        'include: ["**/*.py"]\npr_halo_lines: 5\ncontexts:\n  docs: ["**/*.md"]\n',
+        "utf-8",
+    )
+
+    first = AuditConfig.load(config_path)
+    assert AuditConfig.load(config_path) is first
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.pr_halo_lines = 1  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        first.contexts["docs"] = ()  # type: ignore[index]
+    assert first.contexts["docs"] == ("**/*.md",)
+    assert pickle.loads(pickle.dumps(first)) == first
+
+    config_path.write_text('include: ["**/*.md"]\npr_halo_lines: 12\n', "utf-8")
+    reloaded = AuditConfig.load(config_path)
+    assert reloaded.include == ("**/*.md",)
+    assert reloaded.pr_halo_lines == 12
+
+
+def test_read_base_file_streams_blobs_through_one_cat_file_process(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    blob = "# TODO[owner=@a]: café\n".encode("utf-8")
+    responses = (
+        b"%s blob %d\n%s\n" % (b"a" * 40, len(blob), blob)
+        + b"origin/main:gone.py missing\n"
+        + b"origin/main:docs/My Notes.md missing\n"
+        + b"origin/main:a b c ambiguous\n"
+        + b"%s tree 4\nxxxx\n" % (b"b" * 40)
+    )
+    processes: List[object] = []
+
+    class FakePopen:
+        def __init__(self, args, **_kwargs):
+            assert args == ["git", "cat-file", "--batch"]
+            self.stdin = io.BytesIO()
+            self.stdout = io.BytesIO(responses)
+            processes.append(self)
+
+        def wait(self):
+            return 0
+
+    monkeypatch.setattr("tools.placeholder_audit.subprocess.Popen", FakePopen)
+    with GitCatFileBatch() as reader:
+        assert read_base_file(Path("src/app.py"), "origin/main", reader) == (
+            blob.decode("utf-8")
+        )
+        assert read_base_file(Path("gone.py"), "origin/main", reader) is None
+        assert read_base_file(Path("docs/My Notes.md"), "origin/main", reader) is None
+        assert read_base_file(Path("a b c"), "origin/main", reader) is None
+        assert read_base_file(Path("src"), "origin/main", reader) is None
+    assert len(processes) == 1
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [AgeThresholds, AuditConfig, AuditReport, DiffFile, DiffLine, PlaceholderRecord],
+)
+def test_audit_dataclasses_use_slots(cls: type) -> None:
+    assert "__slots__" in vars(cls)
+    assert "__dict__" not in vars(cls)
+
+
+def test_detect_placeholders_skips_content_without_markers(
+    monkeypatch: pytest.MonkeyPatch, audit_config: AuditConfig
+) -> None:
+    def fail(_content: str) -> None:
+        raise AssertionError("marker-free content should not be split into lines")
+
+    monkeypatch.setattr("tools.placeholder_audit._candidate_lines", fail)
+    findings = detect_placeholders(
+        path=Path("src/app.py"),
+        content="value = 1\r\x0cTOD0 is not a marker\n" * 50,
+        new_lines={idx: "+" for idx in range(1, 101)},
+        context="code",
+        config=audit_config,
+        inside_fence_lines=set(),
+    )
+    assert findings == []
+
+
+def test_format_table_pads_columns_to_widest_cell() -> None:
+    finding = PlaceholderRecord(
+        marker="FIXME",
+        attributes={},
+        text="fix",
+        file_path=Path("src/app.py"),
+        line_number=120,
+        context="prod_code",
+        inside_fence=False,
+        severity="HIGH",
+        score=1.5,
+        reasons=["missing owner", "missing due"],
+        suggested_fix="Add owner",
+        expired=False,
+        is_added_or_modified=True,
+    )
+    assert format_table([finding]).splitlines() == [
+        "File       | Line | Marker | Severity | Reason                    ",
+        "-----------+------+--------+----------+---------------------------",
+        "src/app.py | 120  | FIXME  | HIGH     | missing owner; missing due",
+    ]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        finding.file_path = Path("src/other.py")  # type: ignore[misc]
+    finding.reasons.append("stale")
+    assert finding.reason_text == "missing owner; missing due; stale"
+
+
+def test_summarize_and_delta_count_each_severity_once() -> None:
+    base = PlaceholderRecord(
+        marker="TODO",
+        attributes={},
+        text="fix",
+        file_path=Path("src/app.py"),
+        line_number=1,
+        context="prod_code",
+        inside_fence=False,
+        severity="HIGH",
+        score=1.5,
+        reasons=[],
+        suggested_fix="",
+        expired=False,
+        is_added_or_modified=False,
+    )
+    findings = [
+        base,
+        dataclasses.replace(base, line_number=2, is_added_or_modified=True),
+        dataclasses.replace(base, line_number=3, severity="LOW"),
+    ]
+    summary = summarize(findings)
+    assert summary["total"] == 3
+    assert summary["by_severity"] == {"HIGH": 2, "MED": 0, "LOW": 1}
+    assert summary["high_legacy"] == [base]
+    assert compute_delta(findings, [base]) == (1, 2, 1)
+    assert compute_delta([base], findings) == (2, 1, 0)
+
+
+def test_make_evaluator_binds_config_settings(audit_config: AuditConfig) -> None:
+    config = dataclasses.replace(
+        audit_config,
+        required_fields=("owner", "issue"),
+        age_threshold_days=AgeThresholds(warn=1, high=2),
+    )
+    evaluate = config.make_evaluator()
+    arguments = dict(
+        marker="TODO",
+        attributes={"due": "2030-01-01"},
+        text="fix",
+        context="tests",
+        age_days=3,
+        inside_fence=False,
+        today=dt.date(2029, 12, 1),
+    )
+    result = evaluate(**arguments)
+    assert result == evaluate_placeholder(config=config, **arguments)
+    severity, _, reasons, _, expired = result
+    assert severity == "MED"
+    assert reasons == ["missing fields: owner, issue", "age > 90d"]
+    assert not expired
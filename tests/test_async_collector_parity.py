@@ -10,7 +10,7 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from config.settings import RATE_LIMITING_CONFIG
+from config.settings import COLLECTION_CONFIG, RATE_LIMITING_CONFIG
 
 from src.collectors.async_rss_collector import AsyncRSSCollector
 
@@ -202,3 +202,98 @@ async def test_async_collector_serializes_per_domain_requests(
     assert async_collector._domain_next_time["example.com"] == pytest.approx(
         current_time["value"]
     )
+
+
+@pytest.mark.anyio
+async def test_async_collector_reuses_injected_client(
+    async_collector: AsyncRSSCollector, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    seen_clients: List[Any] = []
+
+    async def allow_all(self, client, url):
+        return (True, None)
+
+    async def fake_fetch(self, client, source_id, url):
+        seen_clients.append(client)
+        return (None, 304)
+
+    async def no_wait(self, *_args):
+        return None
+
+    monkeypatch.setattr(AsyncRSSCollector, "_arespect_robots", allow_all, raising=False)
+    monkeypatch.setattr(
+        AsyncRSSCollector, "_fetch_feed_async", fake_fetch, raising=False
+    )
+    monkeypatch.setattr(
+        AsyncRSSCollector,
+        "_a_enforce_domain_rate_limit",
+        no_wait,
+        raising=False,
+    )
+
+    first = {
+        "src-a": {
+            "name": "Example A",
+            "url": "https://a.example.com/feed",
+            "category": "test",
+            "credibility_score": 0.5,
+        },
+    }
+    second = {
+        "src-b": {
+            "name": "Example B",
+            "url": "https://b.example.com/feed",
+            "category": "test",
+            "credibility_score": 0.5,
+        },
+    }
+
+    async with httpx.AsyncClient() as client:
+        await async_collector.collect_from_multiple_sources_async(first, client=client)
+        await async_collector.collect_from_multiple_sources_async(second, client=client)
+        assert not client.is_closed
+
+    assert seen_clients == [client, client]
+
+
+@pytest.mark.anyio
+async def test_async_collector_honours_constructor_concurrency(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(COLLECTION_CONFIG, "max_concurrent_requests", 8)
+    collector = AsyncRSSCollector(max_concurrent_requests=1)
+    collector.db_manager = MockDB()
+    active = 0
+    peak = 0
+
+    async def fake_process(self, client, source_id, config):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {
+            "source_id": source_id,
+            "success": True,
+            "articles_found": 0,
+            "articles_saved": 0,
+            "error_message": None,
+            "processing_time": 0,
+        }
+
+    monkeypatch.setattr(AsyncRSSCollector, "_process_source_async", fake_process)
+    sources = {
+        f"src-{index}": {
+            "name": f"Example {index}",
+            "url": f"https://{index}.example.com/feed",
+            "category": "test",
+            "credibility_score": 0.5,
+        }
+        for index in range(3)
+    }
+
+    async with httpx.AsyncClient() as client:
+        await collector.collect_from_multiple_sources_async(sources, client=client)
+
+    assert peak == 1
+    assert COLLECTION_CONFIG["max_concurrent_requests"] == 8
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
+import pytest
+
 from tools.fix_makefile_tabs import fix_paths
 
 
@@ -37,3 +40,39 @@ def test_fix_paths_check_mode_leaves_file_unchanged(tmp_path: Path) -> None:
 
     assert exit_code == 1
     assert makefile.read_text(encoding="utf-8") == original
+
+
+def test_fix_paths_skips_files_without_space_indented_lines(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    makefile = tmp_path / "Makefile"
+    original = "target: dep  other\n\techo  spaced  args\n"
+    makefile.write_text(original, encoding="utf-8")
+
+    exit_code = fix_paths((makefile,), tab_size=8, check_only=True)
+
+    assert exit_code == 0
+    assert capsys.readouterr().out == ""
+    assert makefile.read_text(encoding="utf-8") == original
+
+
+def test_fix_paths_preserves_crlf_line_endings(tmp_path: Path) -> None:
+    makefile = tmp_path / "Makefile"
+    makefile.write_bytes(b"target:\r\n    echo crlf\r\n\techo ok\r\n")
+
+    exit_code = fix_paths((makefile,), tab_size=8, check_only=False)
+
+    assert exit_code == 0
+    assert makefile.read_bytes() == b"target:\r\n\techo crlf\r\n\techo ok\r\n"
+
+
+def test_fix_paths_reports_missing_file_as_json(tmp_path: Path) -> None:
+    missing = tmp_path / "Makefile"
+
+    with pytest.raises(FileNotFoundError) as excinfo:
+        fix_paths((missing,), tab_size=8, check_only=True)
+
+    assert json.loads(str(excinfo.value)) == {
+        "path": missing.as_posix(),
+        "error": "file does not exist",
+    }
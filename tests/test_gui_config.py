@@ -10,6 +10,9 @@ import pytest
 from noticiencias.config_schema import DEFAULT_CONFIG
 from noticiencias.gui_config import ConfigEditor
 
+# Captured before the shim fixture replaces it with a no-op.
+_APPLY_FILTER = ConfigEditor._apply_filter
+
 
 class _TkVariableStub:
     """Minimal stand-in for tkinter variable classes."""
@@ -51,3 +54,52 @@ def test_format_display_handles_model_config(tk_runtime_shim: None) -> None:
 
     assert isinstance(rendered, str)
     assert "pattern_v1" in rendered
+
+
+def test_schedule_idle_coalesces_repeated_requests(tk_runtime_shim: None) -> None:
+    """Keystroke bursts collapse into a single idle callback."""
+
+    editor = ConfigEditor(DEFAULT_CONFIG)
+    queued: list = []
+    editor._root = SimpleNamespace(after_idle=queued.append)
+    calls: list[str] = []
+
+    def refresh() -> None:
+        calls.append("refresh")
+
+    for _ in range(5):
+        editor._schedule_idle(refresh)
+    assert len(queued) == 1
+
+    queued.pop()()
+    assert calls == ["refresh"]
+
+    editor._schedule_idle(refresh)
+    assert len(queued) == 1
+
+
+def test_apply_filter_matches_case_insensitively(tk_runtime_shim: None) -> None:
+    """Filtering uses the precomputed lowercase keys for names and descriptions."""
+
+    editor = ConfigEditor(DEFAULT_CONFIG)
+    visibility: dict[str, bool] = {}
+
+    def fake_widget(name: str) -> SimpleNamespace:
+        master = SimpleNamespace(
+            grid=lambda: visibility.__setitem__(name, True),
+            grid_remove=lambda: visibility.__setitem__(name, False),
+        )
+        return SimpleNamespace(master=master)
+
+    editor._widgets = {
+        name: fake_widget(name)
+        for name in ("database.connect_timeout", "collection.async_enabled")
+    }
+    editor._search_var.set("  CONNECT_Timeout ")
+
+    _APPLY_FILTER(editor)
+
+    assert visibility == {
+        "database.connect_timeout": True,
+        "collection.async_enabled": False,
+    }
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import mmap
 import sys
 from pathlib import Path
 
@@ -16,15 +17,21 @@ from config.version import (
 )
 
 
+def _file_contains(path: str | Path, needle: str) -> bool:
+    """Search ``path`` for ``needle`` without decoding the file into a string."""
+
+    with open(path, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped.find(needle.encode("utf-8")) != -1
+
+
 def test_python_version_single_source_of_truth() -> None:
     """The declared Python version should match the project metadata and docs."""
 
     # Package metadata must reflect the canonical requirement specifier.
     assert src.__package_info__["python_requires"] == PYTHON_REQUIRES_SPECIFIER
 
-    readme_text = Path("README.md").read_text(encoding="utf-8")
-    assert f"python-{MIN_PYTHON_VERSION_STR}+-blue.svg" in readme_text
-    assert f"Python {MIN_PYTHON_VERSION_STR} o superior" in readme_text
+    assert _file_contains("README.md", f"python-{MIN_PYTHON_VERSION_STR}+-blue.svg")
+    assert _file_contains("README.md", f"Python {MIN_PYTHON_VERSION_STR} o superior")
 
-    setup_text = Path("setup.py").read_text(encoding="utf-8")
-    assert "PYTHON_REQUIRES_SPECIFIER" in setup_text
+    assert _file_contains("setup.py", "PYTHON_REQUIRES_SPECIFIER")
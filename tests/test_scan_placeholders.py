@@ -1,3 +1,7 @@
+import dataclasses
+import json
+import re
+import subprocess
 import sys
 from pathlib import Path
 
@@ -9,15 +13,24 @@ if str(ROOT) not in sys.path:
 
 from tools.scan_placeholders import (
     DEFAULT_EXTENSIONS,
+    FileView,
+    Finding,
+    Pattern,
+    _fallback_yaml_load,
+    _load_patterns_data,
+    apply_git_blame,
     compare_to_baseline,
     detect_commented_code,
+    detect_patterns,
     infer_severity,
     load_patterns,
+    load_patterns_cached,
+    lower_for_literals,
+    read_text,
+    required_literal,
+    scan_plan,
     scan_repository,
-)
-
-PATTERN_PATH = (
-    Path(__file__).resolve().parents[1] / "tools" / "placeholder_patterns.yml"
+    write_json,
 )
 
 TASK_TAG = "".join(("TO", "DO"))
@@ -26,14 +39,116 @@ PASS_SNIPPET = "".join(("pa", "ss"))
 
 
 @pytest.fixture(scope="module")
-def patterns():
-    return load_patterns(PATTERN_PATH)
+def scan_root(tmp_path_factory):
+    root = tmp_path_factory.mktemp("scan")
+    (root / "reports").mkdir()
+    return root
 
 
 @pytest.fixture()
-def repo_root(tmp_path):
-    (tmp_path / "reports").mkdir()
-    return tmp_path
+def repo_root(scan_root, request):
+    sub = scan_root / request.node.name
+    sub.mkdir()
+    return sub
+
+
+def test_pattern_cache_reuses_json_until_file_changes(monkeypatch, tmp_path):
+    pattern_path = tmp_path / "patterns.yml"
+    source = (ROOT / "tools" / "placeholder_patterns.yml").read_text(encoding="utf-8")
+    pattern_path.write_text(source, encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    first = load_patterns_cached(pattern_path, cache_dir)
+    assert first == load_patterns(pattern_path)
+    (cache_file,) = cache_dir.glob("*.json")
+    cached = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert [entry["tag"] for entry in cached["patterns"]] == [p.tag for p in first]
+
+    def fail(_path):
+        raise AssertionError("pattern file parsed again")
+
+    monkeypatch.setattr("tools.scan_placeholders._load_patterns_data", fail)
+    assert load_patterns_cached(pattern_path, cache_dir) == first
+
+    pattern_path.write_text(source + "\n", encoding="utf-8")
+    with pytest.raises(AssertionError):
+        load_patterns_cached(pattern_path, cache_dir)
+
+    monkeypatch.undo()
+    cache_file.write_text("not json", encoding="utf-8")
+    assert load_patterns_cached(pattern_path, cache_dir) == first
+
+
+def test_pattern_file_parses_the_same_with_and_without_pyyaml():
+    pytest.importorskip("yaml")
+    pattern_path = ROOT / "tools" / "placeholder_patterns.yml"
+    loaded = _load_patterns_data(pattern_path)
+    assert loaded["patterns"]
+    assert loaded == _fallback_yaml_load(pattern_path.read_text(encoding="utf-8"))
+
+
+def test_fallback_yaml_inline_lists_split_on_unquoted_commas():
+    loaded = _fallback_yaml_load(
+        "plain: [a, b ,, true]\nquoted: [\"x, y\", 'z']\nempty: []\n"
+    )
+    assert loaded == {"plain": ["a", "b", True], "quoted": ["x, y", "z"], "empty": []}
+
+
+def test_scan_plan_folds_word_patterns_without_losing_overlaps(patterns):
+    plan = scan_plan(tuple(patterns))
+    folded = [indices for _, indices, _, _ in plan if len(indices) > 1]
+    assert folded
+    assert sum(len(indices) for _, indices, _, _ in plan) == len(patterns)
+
+    text = (
+        f"<!-- {TASK_TAG} later -->\n"
+        f"x = 1  # {TASK_TAG.lower()} fixme: {{{{ your_name }}}}\n"
+    )
+    findings = detect_patterns(
+        Path("page.html"), "page.html", FileView(text), patterns, 0
+    )
+    expected = [
+        (pattern.tag, text.count("\n", 0, match.start()) + 1)
+        for pattern in patterns
+        for match in pattern.compiled.finditer(text)
+    ]
+    assert [(f.tag, f.line_start) for f in findings] == expected
+    assert {"HTML_TODO", TASK_TAG, "TBD_TEMPLATE", "YOUR_UNDERSCORE"} <= {
+        tag for tag, _ in expected
+    }
+
+
+def test_detect_patterns_line_numbers_match_newline_counts():
+    regex = r"^STUB(?:\n\s+body)?"
+    pattern = Pattern(
+        tag="STUB",
+        kind="stub",
+        regex=regex,
+        description="",
+        suggested_fix="",
+        flags=("MULTILINE",),
+        compiled=re.compile(regex, re.MULTILINE),
+    )
+    text = "STUB\n\n\nSTUB\n  body\nend\nSTUB"
+    findings = detect_patterns(Path("a.txt"), "a.txt", FileView(text), [pattern], 0)
+    assert [(f.line_start, f.line_end) for f in findings] == [
+        (1, 1),
+        (4, 5),
+        (7, 7),
+    ]
+
+
+def test_required_literal_prefilter_keeps_ignorecase_matches(patterns):
+    assert required_literal(re.compile(r"\braise\s+NotImplementedError")) == (
+        "NotImplementedError"
+    )
+    assert required_literal(re.compile(r"(?i)(?:^|\s)NOTE[:\s]")) == "note"
+    assert required_literal(re.compile(r"(?i)(api|token)\s*[:=]")) == ""
+
+    # re's IGNORECASE lets "i" match the dotless and dotted capital I.
+    text = "# pend\u0131ng: LOREM IP\u017fUM\n"
+    assert "pending" in lower_for_literals(text)
+    findings = detect_patterns(Path("a.md"), "a.md", FileView(text), patterns, 0)
+    assert {"LOREM_IPSUM", BACKLOG_TAG} <= {f.tag for f in findings}
 
 
 def write_file(path: Path, content: str) -> None:
@@ -139,7 +254,7 @@ def test_commented_code_block_detected(repo_root):
     findings = detect_commented_code(
         Path("stub.py"),
         "stub.py",
-        text,
+        FileView(text),
         context=1,
     )
     assert findings
@@ -176,6 +291,29 @@ def test_baseline_comparison(repo_root, patterns):
     assert len(resolved_only) == 1
 
 
+def test_baseline_comparison_keeps_scan_order():
+    findings = [
+        Finding(
+            tag=TASK_TAG,
+            kind="todo",
+            file=f"pkg/mod{idx}.py",
+            line_start=1,
+            line_end=1,
+            snippet=f"# {TASK_TAG} {idx}",
+            description="d",
+            severity="high",
+            suggested_fix="f",
+        )
+        for idx in range(4)
+    ]
+    baseline = [findings[1].to_dict(), {**findings[2].to_dict(), "file": "gone.py"}]
+
+    new, resolved = compare_to_baseline(findings, baseline)
+
+    assert new == [findings[0], findings[2], findings[3]]
+    assert resolved == [baseline[1]]
+
+
 def test_ignore_cache_directory(repo_root, patterns):
     write_file(
         repo_root / "__pycache__" / "ignored.py",
@@ -191,7 +329,181 @@ def test_ignore_cache_directory(repo_root, patterns):
     assert all("__pycache__" not in f.file for f in findings)
 
 
+def test_scan_cache_reuses_unchanged_files(repo_root, patterns, tmp_path):
+    cache_path = tmp_path / "scan.sqlite"
+    target = repo_root / "module.py"
+    write_file(target, f"# {TASK_TAG}: cached\n")
+    first = scan_repository(
+        repo_root, patterns, DEFAULT_EXTENSIONS, [], context=1, cache_path=cache_path
+    )
+    second = scan_repository(
+        repo_root, patterns, DEFAULT_EXTENSIONS, [], context=1, cache_path=cache_path
+    )
+    assert [f.to_dict() for f in second] == [f.to_dict() for f in first]
+
+    write_file(target, "value = 1\n# nothing left here\n")
+    refreshed = scan_repository(
+        repo_root, patterns, DEFAULT_EXTENSIONS, [], context=1, cache_path=cache_path
+    )
+    assert all(f.tag != TASK_TAG for f in refreshed)
+
+
+def test_parallel_scan_matches_serial_scan(repo_root, patterns, monkeypatch):
+    for idx in range(6):
+        write_file(repo_root / f"pkg{idx}" / "mod.py", f"# {TASK_TAG}: item {idx}\n")
+    cache_path = repo_root / "reports" / "cache.sqlite"
+    serial = scan_repository(repo_root, patterns, DEFAULT_EXTENSIONS, [], context=0)
+
+    monkeypatch.setattr("tools.scan_placeholders._PARALLEL_SCAN_MIN_FILES", 2)
+    monkeypatch.setattr("tools.scan_placeholders.os.cpu_count", lambda: 2)
+    parallel = scan_repository(
+        repo_root, patterns, DEFAULT_EXTENSIONS, [], context=0, cache_path=cache_path
+    )
+    cached = scan_repository(
+        repo_root, patterns, DEFAULT_EXTENSIONS, [], context=0, cache_path=cache_path
+    )
+
+    assert len(serial) == 6
+    assert parallel == serial
+    assert cached == serial
+
+
+def test_read_text_translates_newlines_and_drops_invalid_bytes(tmp_path):
+    path = tmp_path / "mixed.txt"
+    path.write_bytes(b"caf\xc3\xa9\r\nbad \xff byte\rlast\n")
+    assert read_text(path) == "caf\u00e9\nbad  byte\nlast\n"
+
+
+def test_write_json_matches_stdlib_encoding(monkeypatch, tmp_path):
+    finding = Finding(
+        tag=TASK_TAG,
+        kind="todo",
+        file="docs/gu\u00eda.md",
+        line_start=3,
+        line_end=4,
+        snippet='ca\u00f1\u00f3n "quoted"\n\tnext',
+        description="d",
+        severity="low",
+        suggested_fix="f",
+    )
+    expected = json.dumps([finding.to_dict()], indent=2, ensure_ascii=False)
+
+    write_json(tmp_path / "fast.json", [finding])
+    monkeypatch.setattr("tools.scan_placeholders._orjson", None)
+    write_json(tmp_path / "stdlib.json", [finding])
+
+    assert (tmp_path / "fast.json").read_text(encoding="utf-8") == expected
+    assert (tmp_path / "stdlib.json").read_text(encoding="utf-8") == expected
+
+
 def test_infer_severity_levels():
     assert infer_severity(Path("file.py")) == "high"
     assert infer_severity(Path("config.yaml")) == "medium"
     assert infer_severity(Path("README.md")) == "low"
+    assert infer_severity(Path("NOTES.TXT")) == "low"
+    assert infer_severity(Path("archive.bin")) == "medium"
+
+
+def test_apply_git_blame_runs_one_porcelain_blame_per_file(monkeypatch, tmp_path):
+    sha_a, sha_b = "a" * 40, "b" * 40
+    porcelain = "\n".join(
+        [
+            f"{sha_a} 3 3 1",
+            "author Ana María",
+            "author-time 1709353800",
+            "author-tz -0500",
+            "summary first",
+            "filename src/app.py",
+            "\t# first marker",
+            f"{sha_b} 9 7 1",
+            "author Bob",
+            "author-time 1709235000",
+            "author-tz +0530",
+            "filename src/app.py",
+            "\t# second marker",
+        ]
+    )
+    calls = []
+
+    def fake_run(args, **_kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout=porcelain, stderr="")
+
+    monkeypatch.setattr("tools.scan_placeholders.subprocess.run", fake_run)
+    monkeypatch.setattr("tools.scan_placeholders.GIT_BLAME_CACHE", {})
+    finding = Finding(
+        tag=TASK_TAG,
+        kind="todo",
+        file="src/app.py",
+        line_start=3,
+        line_end=3,
+        snippet="# first marker",
+        description="",
+        severity="high",
+        suggested_fix="",
+    )
+    findings = [finding, dataclasses.replace(finding, line_start=7, line_end=7)]
+    apply_git_blame(tmp_path, findings)
+
+    assert calls == [
+        ["git", "blame", "--porcelain", "-L", "3,3", "-L", "7,7", "--", "src/app.py"]
+    ]
+    assert [(f.author, f.author_time) for f in findings] == [
+        ("Ana María", "2024-03-01"),
+        ("Bob", "2024-03-01"),
+    ]
+
+
+def test_apply_git_blame_reuses_cached_lines_for_unchanged_head_and_blob(
+    monkeypatch, tmp_path
+):
+    porcelain = "\n".join(
+        [
+            f"{'a' * 40} 3 3 1",
+            "author Ana",
+            "author-time 1709353800",
+            "author-tz +0000",
+            "filename src/app.py",
+            "\t# marker",
+        ]
+    )
+    oids = {"rev-parse": "b" * 40, "hash-object": "c" * 40}
+    calls = []
+
+    def fake_run(args, **_kwargs):
+        calls.append(args[1])
+        stdout = f"{oids[args[1]]}\n" if args[1] in oids else porcelain
+        return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr("tools.scan_placeholders.subprocess.run", fake_run)
+    finding = Finding(
+        tag=TASK_TAG,
+        kind="todo",
+        file="src/app.py",
+        line_start=3,
+        line_end=3,
+        snippet="# marker",
+        description="",
+        severity="high",
+        suggested_fix="",
+    )
+    cache_path = tmp_path / "cache.sqlite"
+
+    def blame_once() -> Finding:
+        monkeypatch.setattr("tools.scan_placeholders.GIT_BLAME_CACHE", {})
+        findings = [finding]
+        apply_git_blame(tmp_path, findings, cache_path=cache_path)
+        return findings[0]
+
+    assert blame_once().author == "Ana"
+    assert blame_once().author == "Ana"
+    assert calls == ["rev-parse", "hash-object", "blame", "rev-parse", "hash-object"]
+
+    oids["hash-object"] = "d" * 40
+    assert blame_once().author_time == "2024-03-02"
+    assert calls[-3:] == ["rev-parse", "hash-object", "blame"]
+
+    # Same content after a rebase or amend: the author may differ, so re-blame.
+    oids["rev-parse"] = "e" * 40
+    assert blame_once().author == "Ana"
+    assert calls[-3:] == ["rev-parse", "hash-object", "blame"]
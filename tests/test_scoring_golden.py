@@ -7,7 +7,7 @@ import sys
 from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 import pytest
 
@@ -26,17 +26,18 @@ DATA_PATH = Path(__file__).resolve().parent / "data" / "scoring_golden.json"
 ABS_TOL = 1e-6
 
 
-def _load_dataset() -> Dict[str, Any]:
-    with DATA_PATH.open(encoding="utf-8") as fh:
-        return json.load(fh)
-
-
 def _to_article_namespace(payload: Dict[str, Any]) -> SimpleNamespace:
     article_payload = dict(payload)
     article_payload.setdefault("article_metadata", {})
     return SimpleNamespace(**article_payload)
 
 
+_GOLDEN: Dict[str, Any] = json.loads(DATA_PATH.read_bytes())
+_ARTICLES: List[Tuple[Dict[str, Any], SimpleNamespace]] = [
+    (entry, _to_article_namespace(entry["article"])) for entry in _GOLDEN["articles"]
+]
+
+
 class _FrozenDateTime(datetime):
     """Helper used to freeze `datetime.now` inside the scorer module."""
 
@@ -49,6 +50,22 @@ class _FrozenDateTime(datetime):
         return cls.frozen_value
 
 
+@pytest.fixture(scope="module")
+def scored_golden() -> Tuple[Dict[str, Any], List[Tuple[Dict[str, Any], Dict]]]:
+    """Score every golden article once and share the results across components."""
+
+    frozen_at = datetime.fromisoformat(_GOLDEN["frozen_at"].replace("Z", "+00:00"))
+    _FrozenDateTime.frozen_value = frozen_at
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(feature_scorer, "datetime", _FrozenDateTime)
+        scorer = FeatureBasedScorer()
+        scored = [
+            (entry, scorer.score_article(article)) for entry, article in _ARTICLES
+        ]
+    return _GOLDEN, scored
+
+
 @pytest.mark.parametrize(
     "component",
     [
@@ -59,20 +76,13 @@ class _FrozenDateTime(datetime):
     ],
 )
 def test_scoring_components_match_golden(
-    monkeypatch: pytest.MonkeyPatch, component: str
+    scored_golden: Tuple[Dict[str, Any], List[Tuple[Dict[str, Any], Dict]]],
+    component: str,
 ) -> None:
-    golden_data = _load_dataset()
-    frozen_at = datetime.fromisoformat(golden_data["frozen_at"].replace("Z", "+00:00"))
-    _FrozenDateTime.frozen_value = frozen_at
-    monkeypatch.setattr(feature_scorer, "datetime", _FrozenDateTime)
-
-    scorer = FeatureBasedScorer()
+    golden_data, scored = scored_golden
     scored_entries = []
 
-    for entry in golden_data["articles"]:
-        article_obj = _to_article_namespace(entry["article"])
-        score = scorer.score_article(article_obj)
-
+    for entry, score in scored:
         expected = entry["expected"]
         assert score["should_include"] == expected["should_include"]
         assert score["final_score"] == pytest.approx(
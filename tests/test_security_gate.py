@@ -9,24 +9,46 @@ import pytest
 
 from scripts import security_gate
 
-
-def test_load_json_lines_handles_json_lines(tmp_path: Path) -> None:
-    report = tmp_path / "gitleaks.json"
-    payload = {
-        "file": "alerts/exposed_key.txt",
+GITLEAKS_RECORDS = [
+    {
+        "file": "alerts/critical.txt",
+        "secret": "abcd1234abcd1234",
+        "ruleID": "generic-api-key",
+        "severity": "HIGH",
+    },
+    {
+        "file": "ignore/fixture.txt",
+        "secret": "abcd1234abcd1234",
+        "ruleID": "generic-api-key",
+        "severity": "HIGH",
+    },
+    {
+        "file": "alerts/medium.txt",
         "secret": "abcd1234abcd1234",
         "ruleID": "generic-api-key",
-    }
-    report.write_text("\n".join(json.dumps(payload) for _ in range(2)), encoding="utf-8")
+        "severity": "LOW",
+    },
+]
+
+
+@pytest.fixture(scope="module")
+def gitleaks_report(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    report = tmp_path_factory.mktemp("gitleaks") / "report.json"
+    report.write_text(
+        "\n".join(json.dumps(item) for item in GITLEAKS_RECORDS), encoding="utf-8"
+    )
+    return report
 
-    records = security_gate._load_json_lines(report)  # type: ignore[attr-defined]
 
-    assert len(records) == 2
-    assert records[0]["file"] == "alerts/exposed_key.txt"
+def test_load_json_lines_handles_json_lines(gitleaks_report: Path) -> None:
+    records = security_gate._load_json_lines(gitleaks_report)  # type: ignore[attr-defined]
+
+    assert len(records) == 3
+    assert records[0]["file"] == "alerts/critical.txt"
 
 
 def test_gitleaks_findings_enforces_allowlist_and_severity(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    gitleaks_report: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     config = tmp_path / ".gitleaks.toml"
     config.write_text(
@@ -35,30 +57,7 @@ def test_gitleaks_findings_enforces_allowlist_and_severity(
     )
     monkeypatch.setattr(security_gate, "GITLEAKS_CONFIG", config, raising=False)
 
-    report = tmp_path / "report.json"
-    findings = [
-        {
-            "file": "alerts/critical.txt",
-            "secret": "abcd1234abcd1234",
-            "ruleID": "generic-api-key",
-            "severity": "HIGH",
-        },
-        {
-            "file": "ignore/fixture.txt",
-            "secret": "abcd1234abcd1234",
-            "ruleID": "generic-api-key",
-            "severity": "HIGH",
-        },
-        {
-            "file": "alerts/medium.txt",
-            "secret": "abcd1234abcd1234",
-            "ruleID": "generic-api-key",
-            "severity": "LOW",
-        },
-    ]
-    report.write_text("\n".join(json.dumps(item) for item in findings), encoding="utf-8")
-
-    gated = security_gate.gitleaks_findings(report, "HIGH")
+    gated = security_gate.gitleaks_findings(gitleaks_report, "HIGH")
 
     assert gated == [
         {
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 import pytest
 from fastapi.testclient import TestClient
@@ -11,10 +11,9 @@ from src.storage.models import Article, ScoreLog
 pytestmark = pytest.mark.e2e
 
 
-@pytest.fixture()
-def db_manager(tmp_path) -> DatabaseManager:
-    db_path = tmp_path / "api.db"
-    manager = DatabaseManager({"type": "sqlite", "path": db_path})
+@pytest.fixture(scope="module")
+def db_manager() -> DatabaseManager:
+    manager = DatabaseManager({"type": "sqlite", "memory": True})
     with manager.get_session() as session:
         base_time = datetime.now(timezone.utc)
         articles: List[Dict] = [
@@ -125,10 +124,13 @@ def db_manager(tmp_path) -> DatabaseManager:
     return manager
 
 
-@pytest.fixture()
-def api_client(db_manager: DatabaseManager) -> TestClient:
+@pytest.fixture(scope="module")
+def api_client(db_manager: DatabaseManager) -> Iterator[TestClient]:
     app = create_app(database_manager=db_manager)
-    return TestClient(app)
+    # Entering the client keeps one portal/event loop alive for every request
+    # instead of starting a new one per call.
+    with TestClient(app) as client:
+        yield client
 
 
 def test_articles_filtering_and_why_ranked(api_client: TestClient):
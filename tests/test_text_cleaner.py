@@ -33,8 +33,8 @@ def test_language_detection_simple():
     assert detect_language_simple(en) == "en"
 
 
+# Budget comes from the active Hypothesis profile (see tests/conftest.py).
 @given(text=st.text())
-@settings(max_examples=75)
 def test_normalize_text_idempotent_property(text: str) -> None:
     once = normalize_text(text)
     twice = normalize_text(once)
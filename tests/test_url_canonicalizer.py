@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 import src.utils.url_canonicalizer as url_canonicalizer
@@ -71,6 +73,18 @@ def test_canonicalize_cache_configuration() -> None:
     assert hasattr(url_canonicalizer.canonicalize_url, "cache_info")
 
 
+def test_bounded_cache_evicts_safely_across_threads() -> None:
+    cached = url_canonicalizer._bounded_cache(str.upper, 4)
+    urls = [f"https://example.com/{index % 64}" for index in range(4000)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(cached, urls))
+
+    assert results == [url.upper() for url in urls]
+    info = cached.cache_info()  # type: ignore[attr-defined]
+    assert info.currsize <= 4
+
+
 def test_canonicalize_handles_empty_input() -> None:
     assert url_canonicalizer.canonicalize_url("") == ""
     assert url_canonicalizer.canonicalize_url("   ") == ""
@@ -100,3 +114,24 @@ def test_canonicalize_converts_non_http_scheme() -> None:
 
 def test_canonicalize_preserves_non_web_scheme_without_host() -> None:
     assert url_canonicalizer.canonicalize_url("mailto:") == "mailto:"
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("https://example.com/a?b=2&a=1", "https://example.com/a?a=1&b=2"),
+        ("https://example.com/a?a=1&a=1", "https://example.com/a?a=1"),
+        ("https://www.example.com/a", "https://example.com/a"),
+        ("https://example.com/story/amp", "https://example.com/story/"),
+        ("https://example.com/a/../b", "https://example.com/b"),
+        ("https://example.com", "https://example.com/"),
+    ],
+)
+def test_canonical_shaped_urls_still_normalized(raw: str, expected: str) -> None:
+    assert url_canonicalizer._canonicalize_url_impl(raw) == expected
+
+
+def test_already_canonical_url_is_returned_unchanged() -> None:
+    url = "https://example.com/news/story?id=42&page=2"
+    assert url_canonicalizer._is_already_canonical(url)
+    assert url_canonicalizer._canonicalize_url_impl(url) is url
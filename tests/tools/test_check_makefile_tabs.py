@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
+import pytest
+
 from tools.check_makefile_tabs import find_tab_violations, validate_makefiles
 
 
@@ -25,3 +28,37 @@ def test_validate_makefiles_accepts_tab_indented_recipe(tmp_path: Path) -> None:
     exit_code = validate_makefiles((makefile,))
 
     assert exit_code == 0
+
+
+def test_find_tab_violations_skips_comments_and_blank_lines(tmp_path: Path) -> None:
+    makefile = tmp_path / "Makefile"
+    makefile.write_bytes(b"a:\r\n    # note\r\n   \r\n\techo ok\r\n  \techo bad\r\n")
+
+    violations = find_tab_violations(makefile)
+
+    assert [(v.line_number, v.line) for v in violations] == [(5, "  \techo bad")]
+
+
+def test_validate_makefiles_reports_missing_file_as_json(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    missing = tmp_path / 'we"ird\\name'
+
+    exit_code = validate_makefiles((missing,))
+
+    assert exit_code == 1
+    payload = json.loads(capsys.readouterr().err)
+    assert payload == {"path": missing.as_posix(), "error": "file does not exist"}
+
+
+def test_validate_makefiles_emits_one_json_line_per_violation(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    makefile = tmp_path / "Makefile"
+    makefile.write_text("a:\n  echo one\n  echo two\n", encoding="utf-8")
+
+    exit_code = validate_makefiles((makefile,))
+
+    assert exit_code == 1
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["line"] for record in records] == [2, 3]
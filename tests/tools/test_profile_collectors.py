@@ -0,0 +1,119 @@
+"""Tests for the collector profiling sweep helpers."""
+
+from __future__ import annotations
+
+import math
+from array import array
+
+import numpy as np
+import pytest
+
+from src.perf import build_source_config, load_replay_fixture
+
+from tools.perf.profile_collectors import (
+    _aggregate_runs,
+    _chunk_sources,
+    _collect_shard,
+    _hotspot_profiler,
+    _ideal_duration,
+    _quantiles,
+    _speedups,
+    _summarize_requests,
+)
+
+
+def test_summarize_requests_interpolates_percentiles() -> None:
+    summary = _summarize_requests(
+        array("d", [10.0, 20.0, 30.0, 40.0]), array("i", [200, 200, 304, 500])
+    )
+
+    assert summary["avg_latency_ms"] == pytest.approx(25.0)
+    assert summary["p50_latency_ms"] == pytest.approx(25.0)
+    assert summary["p95_latency_ms"] == pytest.approx(38.5)
+    assert summary["status_counts"] == {200: 2, 304: 1, 500: 1}
+
+
+def test_summarize_requests_handles_empty_input() -> None:
+    assert _summarize_requests(array("d"), array("i")) == {
+        "avg_latency_ms": 0.0,
+        "p50_latency_ms": 0.0,
+        "p95_latency_ms": 0.0,
+        "status_counts": {},
+    }
+
+
+def test_chunk_sources_preserves_order_and_remainder() -> None:
+    sources = {
+        f"s{index}": {"url": f"https://example.com/{index}"} for index in range(5)
+    }
+
+    batches = _chunk_sources(sources, 2)
+
+    assert [list(batch) for batch in batches] == [["s0", "s1"], ["s2", "s3"], ["s4"]]
+
+
+def test_speedups_divide_baseline_and_flag_zero_durations() -> None:
+    rows = [{"duration_s": 2.0}, {"duration_s": 0.0}, {"duration_s": 0.5}]
+
+    assert _speedups(1.0, rows) == [0.5, math.inf, 2.0]
+    assert _speedups(1.0, []) == []
+
+
+def test_aggregate_runs_reports_median_duration() -> None:
+    runs = [
+        {"duration_s": 3.0, "articles": 3},
+        {"duration_s": 1.0, "articles": 1},
+        {"duration_s": 2.0, "articles": 2},
+    ]
+
+    summary = _aggregate_runs(runs)
+
+    assert summary["duration_s"] == pytest.approx(2.0)
+    assert summary["duration_p95_s"] == pytest.approx(2.9)
+    assert summary["articles"] == 2
+    assert summary["repeat"] == 3
+    assert _aggregate_runs(runs[:1]) is runs[0]
+
+
+def test_collect_shard_limits_requests_to_its_sources() -> None:
+    events = load_replay_fixture("tests/data/perf/rss_load_sample.jsonl")
+    sources = build_source_config(events)
+    source_id = next(iter(sources))
+
+    stats = _collect_shard((events, {source_id: sources[source_id]}))
+
+    assert stats["requests"] == 1
+    assert len(stats["latencies_ms"]) == len(stats["status_codes"]) == 1
+    assert stats["articles"] >= 1
+
+
+def test_hotspot_profiler_ranks_functions_by_self_time() -> None:
+    with _hotspot_profiler(3) as hotspots:
+        sorted(range(50_000), key=lambda value: -value)
+
+    assert 0 < len(hotspots) <= 3
+    self_times = [entry["self_s"] for entry in hotspots]
+    assert self_times == sorted(self_times, reverse=True)
+    assert {"function", "calls", "self_s", "cumulative_s"} <= hotspots[0].keys()
+
+    with _hotspot_profiler(0) as disabled:
+        sum(range(10))
+    assert disabled == []
+
+
+def test_ideal_duration_schedules_requests_on_free_workers() -> None:
+    latencies = array("d", [40.0, 30.0, 20.0, 10.0])
+
+    assert _ideal_duration(latencies, 1) == pytest.approx(0.1)
+    assert _ideal_duration(latencies, 2) == pytest.approx(0.05)
+    assert _ideal_duration(latencies, 8) == pytest.approx(0.04)
+    assert _ideal_duration(array("d"), 4) == 0.0
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 20, 101])
+def test_quantiles_match_numpy_linear_interpolation(size: int) -> None:
+    values = np.random.default_rng(size).random(size) * 100
+
+    assert _quantiles(values, (0.5, 0.95)) == pytest.approx(
+        np.quantile(values, [0.5, 0.95]).tolist()
+    )
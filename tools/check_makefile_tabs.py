@@ -4,10 +4,16 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Sequence
+
+# A violation is a line that starts with a space and, once leading whitespace is
+# skipped, holds something other than a comment. Matching raw bytes avoids
+# decoding the (usually clean) bulk of the file.
+_VIOLATION_RE = re.compile(rb"^ [^\S\n]*[^\s#]", re.MULTILINE)
 
 
 @dataclass(frozen=True)
@@ -19,28 +25,26 @@ class TabViolation:
     line: str
 
 
-def _iter_lines(path: Path) -> Iterable[tuple[int, str]]:
-    content = path.read_text(encoding="utf-8").splitlines()
-    for index, value in enumerate(content, start=1):
-        yield index, value
-
+def find_tab_violations(path: Path, content: bytes | None = None) -> list[TabViolation]:
+    """Return all lines in ``path`` that start with spaces instead of tabs.
 
-def find_tab_violations(path: Path) -> list[TabViolation]:
-    """Return all lines in ``path`` that start with spaces instead of tabs."""
+    Callers that already hold the file's bytes can pass them as ``content`` to
+    skip reading it again. Only offending lines are decoded.
+    """
 
+    if content is None:
+        content = path.read_bytes()
     violations: list[TabViolation] = []
-    for line_number, line in _iter_lines(path):
-        stripped = line.lstrip()
-        if not stripped:
-            continue
-        if stripped.startswith("#"):
-            continue
-        if line.startswith("\t"):
-            continue
-        if line.startswith(" "):
-            violations.append(
-                TabViolation(path=path, line_number=line_number, line=line)
-            )
+    line_number = 1
+    position = 0
+    for match in _VIOLATION_RE.finditer(content):
+        start = match.start()
+        line_number += content.count(b"\n", position, start)
+        position = start
+        end = content.find(b"\n", start)
+        raw_line = content[start:] if end == -1 else content[start:end]
+        line = raw_line.rstrip(b"\r").decode("utf-8", errors="replace")
+        violations.append(TabViolation(path=path, line_number=line_number, line=line))
     return violations
 
 
@@ -58,18 +62,22 @@ def validate_makefiles(paths: Sequence[Path]) -> int:
 
     exit_code = 0
     for path in paths:
-        if not path.exists():
-            message = (
-                f'{{"path": "{path.as_posix()}", "error": "file does not exist"}}\n'
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            message = json.dumps(
+                {"path": path.as_posix(), "error": "file does not exist"},
+                ensure_ascii=False,
             )
-            sys.stderr.write(message)
+            sys.stderr.write(f"{message}\n")
             return 1
-        violations = find_tab_violations(path)
+        violations = find_tab_violations(path, content)
         if not violations:
             continue
         exit_code = 1
-        for violation in violations:
-            sys.stdout.write(f"{_format_violation(violation)}\n")
+        sys.stdout.writelines(
+            f"{_format_violation(violation)}\n" for violation in violations
+        )
     return exit_code
 
 
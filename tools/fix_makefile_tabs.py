@@ -34,17 +34,14 @@ class FixSummary:
 def _convert_line(line: str, tab_size: int) -> tuple[str, bool]:
     """Convert a line to begin with tabs when it starts with spaces."""
 
+    if not line.startswith(" "):
+        return line, False
     stripped = line.lstrip()
     if not stripped or stripped.startswith("#"):
         return line, False
-    if line.startswith("\t"):
-        return line, False
-    if not line.startswith(" "):
-        return line, False
 
     leading_spaces = len(line) - len(line.lstrip(" "))
-    tabs = leading_spaces // tab_size
-    remainder = leading_spaces % tab_size
+    tabs, remainder = divmod(leading_spaces, tab_size)
     if tabs == 0:
         tabs = 1
         remainder = 0
@@ -77,21 +74,27 @@ def fix_paths(paths: Sequence[Path], tab_size: int, check_only: bool) -> int:
 
     exit_code = 0
     for path in paths:
-        if not path.exists():
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError as exc:
             message = json.dumps(
                 {"path": path.as_posix(), "error": "file does not exist"}
             )
-            raise FileNotFoundError(message)
-        content = path.read_text(encoding="utf-8")
-        lines = content.splitlines(keepends=True)
-        violations = tuple(find_tab_violations(path))
+            raise FileNotFoundError(message) from exc
+        if not raw.startswith(b" ") and b"\n " not in raw:
+            # No line starts with a space, so there is nothing to convert.
+            continue
+        # Split on "\n" only so indices line up with find_tab_violations; any
+        # "\r" stays attached to its line and is written back unchanged.
+        lines = raw.decode("utf-8").split("\n")
+        violations = find_tab_violations(path, raw)
         summary = _apply_fixes(path, lines, violations, tab_size)
         if summary is None:
             continue
         if check_only:
             exit_code = 1
         else:
-            path.write_text("".join(lines), encoding="utf-8")
+            path.write_bytes("\n".join(lines).encode("utf-8"))
         sys.stdout.write(f"{summary.to_json()}\n")
     return exit_code
 
@@ -4,77 +4,161 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import cProfile
+import heapq
 import json
-import math
+import multiprocessing
+import pstats
 import sys
-from collections import Counter
+from array import array
+from contextlib import contextmanager
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
-from statistics import mean
-from time import perf_counter, process_time
-from typing import Iterable, List
+from time import perf_counter_ns, process_time_ns
+from typing import Awaitable, Callable, Iterator, List, Sequence
+
+import httpx
+import numpy as np
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
 
 ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from config.settings import COLLECTION_CONFIG
-
-from src.collectors.async_rss_collector import AsyncRSSCollector
+from src.collectors.async_rss_collector import AsyncRSSCollector, build_async_client
 from src.collectors.rss_collector import RSSCollector
 from src.perf import (
     CollectorReplaySession,
     MemoryFeedStore,
     ReplayEvent,
+    build_source_config,
     load_replay_fixture,
 )
 
 
-def _percentile(values: List[float], percentile: float) -> float:
-    if not values:
-        return 0.0
-    sorted_values = sorted(values)
-    k = (len(sorted_values) - 1) * (percentile / 100.0)
-    f = math.floor(k)
-    c = math.ceil(k)
-    if f == c:
-        return sorted_values[int(k)]
-    return sorted_values[f] + (sorted_values[c] - sorted_values[f]) * (k - f)
-
-
 def _summarize_requests(
-    requests: Iterable[dict[str, float | int]],
+    latencies_ms: array[float], status_codes: array[int]
 ) -> dict[str, object]:
-    records = list(requests)
-    if not records:
+    if not latencies_ms:
         return {
             "avg_latency_ms": 0.0,
             "p50_latency_ms": 0.0,
             "p95_latency_ms": 0.0,
             "status_counts": {},
         }
-    latencies = [float(entry["latency_ms"]) for entry in records]
-    statuses = Counter(int(entry["status_code"]) for entry in records)
+    values = np.frombuffer(latencies_ms, dtype=np.float64)
+    p50, p95 = _quantiles(values, (0.5, 0.95))
+    codes, counts = np.unique(
+        np.frombuffer(status_codes, dtype=np.intc), return_counts=True
+    )
+    # np.unique returns sorted codes, matching the previous key order.
     return {
-        "avg_latency_ms": mean(latencies),
-        "p50_latency_ms": _percentile(latencies, 50.0),
-        "p95_latency_ms": _percentile(latencies, 95.0),
-        "status_counts": dict(sorted(statuses.items())),
+        "avg_latency_ms": float(values.mean()),
+        "p50_latency_ms": float(p50),
+        "p95_latency_ms": float(p95),
+        "status_counts": dict(zip(codes.tolist(), counts.tolist(), strict=True)),
     }
 
 
+def _quantiles(values: np.ndarray, probabilities: Sequence[float]) -> List[float]:
+    """Return linearly interpolated quantiles, as ``np.quantile`` does.
+
+    ``np.partition`` places only the needed order statistics, which is O(n)
+    instead of the full sort ``np.quantile`` performs.
+    """
+
+    last = len(values) - 1
+    positions = [probability * last for probability in probabilities]
+    lows = [int(position) for position in positions]
+    kth = sorted({index for low in lows for index in (low, min(low + 1, last))})
+    ranked = np.partition(values, kth)
+    result = []
+    for position, low in zip(positions, lows, strict=True):
+        below = float(ranked[low])
+        above = float(ranked[min(low + 1, last)])
+        result.append(below + (above - below) * (position - low))
+    return result
+
+
+def _ideal_duration(latencies_ms: array[float], workers: int) -> float:
+    """Return the replay makespan in seconds if Python added no overhead.
+
+    Requests are handed in log order to whichever of *workers* slots frees up
+    first, so one worker gives the plain sum of the recorded latencies.
+    """
+
+    if workers <= 1:
+        return sum(latencies_ms) / 1000.0
+    finish = [0.0] * min(workers, len(latencies_ms))
+    for latency in latencies_ms:
+        heapq.heapreplace(finish, finish[0] + latency)
+    return max(finish, default=0.0) / 1000.0
+
+
+def _chunk_sources(
+    sources: dict[str, dict[str, object]], batch_size: int
+) -> List[dict[str, dict[str, object]]]:
+    items = list(sources.items())
+    return [
+        dict(items[index : index + batch_size])
+        for index in range(0, len(items), batch_size)
+    ]
+
+
+@contextmanager
+def _hotspot_profiler(limit: int) -> Iterator[List[dict[str, object]]]:
+    """Profile the block with cProfile and fill the yielded list with hotspots.
+
+    The list holds the *limit* functions with the highest self time. With a
+    non-positive *limit* nothing is profiled and the list stays empty.
+    """
+
+    hotspots: List[dict[str, object]] = []
+    if limit <= 0:
+        yield hotspots
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield hotspots
+    finally:
+        profiler.disable()
+    stats = pstats.Stats(profiler).stats
+    ranked = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)
+    for func, (_, calls, self_time, cumulative, _) in ranked[:limit]:
+        hotspots.append(
+            {
+                "function": pstats.func_std_string(func),
+                "calls": calls,
+                "self_s": self_time,
+                "cumulative_s": cumulative,
+            }
+        )
+
+
 def _run_sync(
-    events: List[ReplayEvent], sources: dict[str, dict[str, object]]
+    events: List[ReplayEvent],
+    sources: dict[str, dict[str, object]],
+    batch_size: int | None = None,
+    hotspots: int = 0,
 ) -> dict[str, object]:
     collector = RSSCollector()
     collector.db_manager = MemoryFeedStore()
     session = CollectorReplaySession(events)
-    with session.patch_collector(collector):
-        start_cpu = process_time()
-        start = perf_counter()
-        collector.collect_from_multiple_sources(sources)
-        duration = perf_counter() - start
-        cpu_time = process_time() - start_cpu
-    summary = _summarize_requests(session.requests)
+    batches = [sources] if batch_size is None else _chunk_sources(sources, batch_size)
+    with session.patch_collector(collector), _hotspot_profiler(hotspots) as top:
+        start_cpu = process_time_ns()
+        start = perf_counter_ns()
+        for batch in batches:
+            collector.collect_from_multiple_sources(batch)
+        duration = (perf_counter_ns() - start) / 1e9
+        cpu_time = (process_time_ns() - start_cpu) / 1e9
+    summary = _summarize_requests(session.latencies_ms, session.status_codes)
     summary.update(
         {
             "duration_s": duration,
@@ -83,6 +167,70 @@ def _run_sync(
             "cpu_time_s": cpu_time,
         }
     )
+    _add_overhead(summary, _ideal_duration(session.latencies_ms, 1))
+    if batch_size is not None:
+        summary["batch_size"] = batch_size
+    if top:
+        summary["hotspots"] = top
+    return summary
+
+
+def _collect_shard(
+    job: tuple[List[ReplayEvent], dict[str, dict[str, object]]],
+) -> dict[str, object]:
+    """Collect one shard of sources in a worker process and return raw stats."""
+
+    events, shard = job
+    collector = RSSCollector()
+    collector.db_manager = MemoryFeedStore()
+    session = CollectorReplaySession(events)
+    with session.patch_collector(collector):
+        start_cpu = process_time_ns()
+        collector.collect_from_multiple_sources(shard)
+        cpu_time = (process_time_ns() - start_cpu) / 1e9
+    return {
+        "latencies_ms": session.latencies_ms,
+        "status_codes": session.status_codes,
+        "articles": len(collector.db_manager.saved_articles),
+        "requests": len(session.requests),
+        "cpu_time_s": cpu_time,
+    }
+
+
+def _run_sync_mp(
+    events: List[ReplayEvent],
+    sources: dict[str, dict[str, object]],
+    processes: int,
+) -> dict[str, object]:
+    # Round-robin keeps shard sizes within one source of each other.
+    items = list(sources.items())
+    shards = [dict(items[index::processes]) for index in range(processes)]
+    jobs = [(events, shard) for shard in shards if shard]
+    with multiprocessing.Pool(processes) as pool:
+        # Workers are started before the clock so only collection is timed.
+        start = perf_counter_ns()
+        parts = pool.map(_collect_shard, jobs)
+        duration = (perf_counter_ns() - start) / 1e9
+    latencies: array[float] = array("d")
+    status_codes: array[int] = array("i")
+    for part in parts:
+        latencies.extend(part["latencies_ms"])
+        status_codes.extend(part["status_codes"])
+    summary = _summarize_requests(latencies, status_codes)
+    summary.update(
+        {
+            "duration_s": duration,
+            "articles": sum(part["articles"] for part in parts),
+            "requests": sum(part["requests"] for part in parts),
+            "processes": processes,
+            "cpu_time_s": sum(part["cpu_time_s"] for part in parts),
+        }
+    )
+    # Shards run side by side, so the slowest shard bounds the ideal time.
+    ideal = max(
+        (_ideal_duration(part["latencies_ms"], 1) for part in parts), default=0.0
+    )
+    _add_overhead(summary, ideal)
     return summary
 
 
@@ -90,22 +238,22 @@ async def _run_async(
     events: List[ReplayEvent],
     sources: dict[str, dict[str, object]],
     concurrency: int,
+    client: httpx.AsyncClient | None = None,
+    hotspots: int = 0,
 ) -> dict[str, object]:
-    collector = AsyncRSSCollector()
+    collector = AsyncRSSCollector(max_concurrent_requests=concurrency)
     collector.db_manager = MemoryFeedStore()
     session = CollectorReplaySession(events)
-    original_concurrency = COLLECTION_CONFIG.get("max_concurrent_requests", 8)
-    COLLECTION_CONFIG["max_concurrent_requests"] = concurrency
-    try:
-        with session.patch_collector(collector, asynchronous=True):
-            start_cpu = process_time()
-            start = perf_counter()
-            await collector.collect_from_multiple_sources_async(sources)
-            duration = perf_counter() - start
-            cpu_time = process_time() - start_cpu
-    finally:
-        COLLECTION_CONFIG["max_concurrent_requests"] = original_concurrency
-    summary = _summarize_requests(session.requests)
+    with (
+        session.patch_collector(collector, asynchronous=True),
+        _hotspot_profiler(hotspots) as top,
+    ):
+        start_cpu = process_time_ns()
+        start = perf_counter_ns()
+        await collector.collect_from_multiple_sources_async(sources, client=client)
+        duration = (perf_counter_ns() - start) / 1e9
+        cpu_time = (process_time_ns() - start_cpu) / 1e9
+    summary = _summarize_requests(session.latencies_ms, session.status_codes)
     summary.update(
         {
             "duration_s": duration,
@@ -115,9 +263,56 @@ async def _run_async(
             "cpu_time_s": cpu_time,
         }
     )
+    _add_overhead(summary, _ideal_duration(session.latencies_ms, concurrency))
+    if top:
+        summary["hotspots"] = top
     return summary
 
 
+def _add_overhead(summary: dict[str, object], ideal: float) -> None:
+    """Record the ideal replay time and how far the measured run exceeded it."""
+
+    summary["ideal_s"] = ideal
+    summary["overhead_s"] = summary["duration_s"] - ideal
+
+
+def _aggregate_runs(runs: List[dict[str, object]]) -> dict[str, object]:
+    """Collapse repeated runs into one summary keyed on the median duration."""
+
+    if len(runs) == 1:
+        return runs[0]
+    durations = np.array([run["duration_s"] for run in runs])
+    median = float(np.median(durations))
+    # Keep the run closest to the median so its request stats match the headline.
+    summary = dict(runs[int(np.argmin(np.abs(durations - median)))])
+    summary.update(
+        {
+            "duration_s": median,
+            "duration_p95_s": float(np.quantile(durations, 0.95)),
+            "repeat": len(runs),
+        }
+    )
+    if "ideal_s" in summary:
+        _add_overhead(summary, summary["ideal_s"])
+    return summary
+
+
+def _measure(
+    run: Callable[[], dict[str, object]], repeat: int, warmup: int
+) -> dict[str, object]:
+    for _ in range(warmup):
+        run()
+    return _aggregate_runs([run() for _ in range(repeat)])
+
+
+async def _measure_async(
+    run: Callable[[], Awaitable[dict[str, object]]], repeat: int, warmup: int
+) -> dict[str, object]:
+    for _ in range(warmup):
+        await run()
+    return _aggregate_runs([await run() for _ in range(repeat)])
+
+
 def _format_duration(seconds: float) -> str:
     return f"{seconds * 1000:.1f} ms"
 
@@ -128,20 +323,99 @@ def _format_throughput(articles: int, seconds: float) -> str:
     return f"{articles / seconds:.1f} items/s"
 
 
+def _speedups(baseline: float, rows: Sequence[dict[str, object]]) -> List[float]:
+    """Return ``baseline / duration`` for every row, ``inf`` for zero durations."""
+
+    durations = np.fromiter(
+        (row["duration_s"] for row in rows), dtype=np.float64, count=len(rows)
+    )
+    speedups = np.full(len(rows), np.inf)
+    np.divide(baseline, durations, out=speedups, where=durations != 0)
+    return speedups.tolist()
+
+
+def _format_rate_columns(articles: int, duration: float, speedup: float) -> str:
+    """Return the duration, throughput and speedup cells of a sweep row."""
+
+    # Same text as _format_duration/_format_throughput, built in one f-string.
+    throughput = f"{articles / duration:.1f} items/s" if duration > 0 else "∞"
+    return f"{duration * 1000:>6.1f} ms | {throughput:>11} | {speedup:>6.2f}x"
+
+
 def profile_collectors(
-    fixture: Path, concurrency_levels: List[int]
+    fixture: Path,
+    concurrency_levels: List[int],
+    sync_batch_sizes: Sequence[int] = (),
+    use_uvloop: bool = False,
+    sync_processes: Sequence[int] = (),
+    repeat: int = 1,
+    warmup: int = 0,
+    hotspots: int = 0,
 ) -> dict[str, object]:
+    run_loop = asyncio.run
+    if use_uvloop:
+        try:
+            import uvloop
+        except ImportError as exc:
+            raise SystemExit("--uvloop requires the optional 'uvloop' package") from exc
+        run_loop = uvloop.run
+
     events = load_replay_fixture(fixture)
-    sources = CollectorReplaySession(events).build_source_config()
+    sources = build_source_config(events)
+
+    # Warm-up runs absorb first-call costs (lazy imports, parser setup) and are
+    # discarded; each timed run still gets a fresh collector and replay session.
+    sync_metrics = _measure(
+        partial(_run_sync, events, sources, hotspots=hotspots), repeat, warmup
+    )
+    batched_metrics = [
+        _measure(
+            partial(_run_sync, events, sources, size, hotspots=hotspots),
+            repeat,
+            warmup,
+        )
+        for size in sync_batch_sizes
+    ]
+    process_metrics = [
+        _measure(partial(_run_sync_mp, events, sources, count), repeat, warmup)
+        for count in sync_processes
+    ]
+
+    async def _sweep() -> List[dict[str, object]]:
+        # Levels run one after another on a single loop and share one HTTP
+        # client, so loop and client/TLS setup stay out of per-level timings.
+        async with build_async_client() as client:
+            return [
+                await _measure_async(
+                    partial(_run_async, events, sources, level, client, hotspots),
+                    repeat,
+                    warmup,
+                )
+                for level in concurrency_levels
+            ]
 
-    sync_metrics = _run_sync(events, sources)
+    async_metrics = run_loop(_sweep())
 
-    async_metrics: List[dict[str, object]] = []
-    for level in concurrency_levels:
-        metrics = asyncio.run(_run_async(events, sources, level))
-        async_metrics.append(metrics)
+    results: dict[str, object] = {"sync": sync_metrics, "async": async_metrics}
+    if batched_metrics:
+        results["sync_batched"] = batched_metrics
+    if process_metrics:
+        results["sync_processes"] = process_metrics
+    return results
 
-    return {"sync": sync_metrics, "async": async_metrics}
+
+# Row accessors for the report tables: one call per row instead of a
+# subscript per column.
+_RATE_FIELDS = itemgetter("articles", "duration_s")
+_ASYNC_FIELDS = itemgetter(
+    "concurrency",
+    "articles",
+    "duration_s",
+    "p50_latency_ms",
+    "p95_latency_ms",
+    "cpu_time_s",
+    "overhead_s",
+)
 
 
 def _print_report(results: dict[str, object]) -> None:
@@ -162,29 +436,86 @@ def _print_report(results: dict[str, object]) -> None:
         )
     )
     print(
-        "cpu: {cpu:.3f}s  io-wait: {io:.3f}s".format(
+        "cpu: {cpu:.3f}s  io-wait: {io:.3f}s  overhead: {overhead:.1f} ms".format(
             cpu=sync_metrics["cpu_time_s"],
             io=max(sync_metrics["duration_s"] - sync_metrics["cpu_time_s"], 0.0),
+            overhead=sync_metrics["overhead_s"] * 1000,
         )
     )
 
+    baseline = sync_metrics["duration_s"]
+    if results.get("sync_batched"):
+        print("\n== Sync batch sweep ==")
+        header = "batch size | duration | throughput | speedup"
+        print(header)
+        print("-" * len(header))
+        batched = results["sync_batched"]
+        for metrics, speedup in zip(batched, _speedups(baseline, batched), strict=True):
+            columns = _format_rate_columns(*_RATE_FIELDS(metrics), speedup)
+            print(f"{metrics['batch_size']:>10} | {columns}")
+
+    if results.get("sync_processes"):
+        print("\n== Sync process sweep ==")
+        header = "processes | duration | throughput | speedup"
+        print(header)
+        print("-" * len(header))
+        sharded = results["sync_processes"]
+        for metrics, speedup in zip(sharded, _speedups(baseline, sharded), strict=True):
+            columns = _format_rate_columns(*_RATE_FIELDS(metrics), speedup)
+            print(f"{metrics['processes']:>9} | {columns}")
+
     print("\n== Async sweep ==")
-    header = "concurrency | duration | throughput | speedup | p50 | p95 | cpu"
+    header = (
+        "concurrency | duration | throughput | speedup | p50 | p95 | cpu | overhead"
+    )
     print(header)
     print("-" * len(header))
-    baseline = sync_metrics["duration_s"]
-    for metrics in results["async"]:
-        duration = metrics["duration_s"]
-        speedup = baseline / duration if duration else float("inf")
+    async_metrics = results["async"]
+    for metrics, speedup in zip(
+        async_metrics, _speedups(baseline, async_metrics), strict=True
+    ):
+        level, articles, duration, p50, p95, cpu, overhead = _ASYNC_FIELDS(metrics)
+        columns = _format_rate_columns(articles, duration, speedup)
         print(
-            f"{metrics['concurrency']:>11} | {_format_duration(duration):>9} | "
-            f"{_format_throughput(metrics['articles'], duration):>11} | {speedup:>6.2f}x | "
-            f"{metrics['p50_latency_ms']:>5.1f} | {metrics['p95_latency_ms']:>5.1f} | "
-            f"{metrics['cpu_time_s']:.3f}s"
+            f"{level:>11} | {columns} | {p50:>5.1f} | {p95:>5.1f} | "
+            f"{cpu:.3f}s | {overhead * 1000:.1f} ms"
         )
+    _print_hotspots(results)
     print()
 
 
+def _print_hotspots(results: dict[str, object]) -> None:
+    sections = [("sync baseline", results["sync"])]
+    sections += [
+        (f"sync batch size {metrics['batch_size']}", metrics)
+        for metrics in results.get("sync_batched", ())
+    ]
+    sections += [
+        (f"async concurrency {metrics['concurrency']}", metrics)
+        for metrics in results["async"]
+    ]
+    for label, metrics in sections:
+        if not metrics.get("hotspots"):
+            continue
+        print(f"\n== Hotspots: {label} ==")
+        print("  self s |  cum s |  calls | function")
+        for entry in metrics["hotspots"]:
+            print(
+                f"{entry['self_s']:>8.4f} | {entry['cumulative_s']:>6.3f} | "
+                f"{entry['calls']:>6} | {entry['function']}"
+            )
+
+
+def _dump_results(results: dict[str, object]) -> bytes:
+    """Serialize *results* as indented JSON bytes, via orjson when installed."""
+
+    if orjson is not None:
+        return orjson.dumps(
+            results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(results, indent=2).encode("utf-8")
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -198,6 +529,49 @@ def parse_args() -> argparse.Namespace:
         default="1,2,4,8",
         help="Comma-separated list of concurrency levels for async sweep.",
     )
+    parser.add_argument(
+        "--sync-batch-sizes",
+        default="",
+        help=(
+            "Optional comma-separated batch sizes; each runs the sync collector "
+            "over the sources in chunks of that size."
+        ),
+    )
+    parser.add_argument(
+        "--sync-processes",
+        default="",
+        help=(
+            "Optional comma-separated process counts; each shards the sources "
+            "across a multiprocessing pool of sync collectors."
+        ),
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Timed runs per configuration; the median duration is reported.",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=0,
+        help="Untimed runs per configuration before the timed ones.",
+    )
+    parser.add_argument(
+        "--hotspots",
+        type=int,
+        default=0,
+        metavar="N",
+        help=(
+            "Profile sync and async runs with cProfile and report the N "
+            "functions with the most self time (adds overhead to timings)."
+        ),
+    )
+    parser.add_argument(
+        "--uvloop",
+        action="store_true",
+        help="Run the async sweep on uvloop (must be installed separately).",
+    )
     parser.add_argument(
         "--output",
         type=Path,
@@ -211,10 +585,33 @@ def main() -> None:
     levels = [int(item) for item in args.concurrency.split(",") if item.strip()]
     if not levels:
         raise SystemExit("At least one concurrency level is required")
-    results = profile_collectors(args.fixture, levels)
+    batch_sizes = [
+        int(item) for item in args.sync_batch_sizes.split(",") if item.strip()
+    ]
+    if any(size < 1 for size in batch_sizes):
+        raise SystemExit("Sync batch sizes must be positive integers")
+    process_counts = [
+        int(item) for item in args.sync_processes.split(",") if item.strip()
+    ]
+    if any(count < 1 for count in process_counts):
+        raise SystemExit("Sync process counts must be positive integers")
+    if args.repeat < 1 or args.warmup < 0:
+        raise SystemExit("--repeat must be positive and --warmup non-negative")
+    if args.hotspots < 0:
+        raise SystemExit("--hotspots must be non-negative")
+    results = profile_collectors(
+        args.fixture,
+        levels,
+        batch_sizes,
+        use_uvloop=args.uvloop,
+        sync_processes=process_counts,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        hotspots=args.hotspots,
+    )
     _print_report(results)
     if args.output:
-        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        args.output.write_bytes(_dump_results(results))
 
 
 if __name__ == "__main__":
@@ -6,12 +6,28 @@ import argparse
 import datetime as dt
 import fnmatch
 import json
+import os
 import re
 import subprocess
 import sys
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 try:  # pragma: no cover - optional dependency
     import yaml as _pyyaml
@@ -21,11 +37,26 @@ try:  # pragma: no cover - optional dependency
     from ruamel.yaml import YAML as _RuamelYAML
 except ModuleNotFoundError:  # pragma: no cover - executed in tests
     _RuamelYAML = None
+try:  # pragma: no cover - optional dependency
+    import orjson as _orjson
+except ModuleNotFoundError:  # pragma: no cover - stdlib json is the fallback
+    _orjson = None
 
 PLACEHOLDER_PATTERN = re.compile(
     r"\b(TODO|FIXME|TBD)\s*\[(?P<attrs>[^\]]+)\]\s*:\s*(?P<text>.+)"
 )
 
+_MARKERS = ("TODO", "FIXME", "TBD")
+_FENCE_DELIMITERS = ("```", "~~~")
+# Line breaks besides "\n" that str.splitlines() honours ("\r" is checked apart).
+_EXTRA_LINE_BREAKS = "\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
+# "<sha> <orig-line> <final-line> <count>" range header of incremental blame.
+_BLAME_HEADER = re.compile(r"^([0-9a-f]{40,64}) \d+ (\d+) (\d+)$")
+
+# scan_files fans out to worker processes above this many diff entries.
+_PARALLEL_SCAN_MIN_FILES = 32
+
 CONFIG_PATH = Path(".placeholder-audit.yaml")
 
 CONTEXT_WEIGHTS: Dict[str, float] = {
@@ -48,17 +79,17 @@ class PlaceholderAuditError(RuntimeError):
     """Raised when the audit cannot be executed."""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgeThresholds:
     warn: int
     high: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AuditConfig:
     include: Sequence[str]
     exclude: Sequence[str]
-    contexts: Dict[str, Sequence[str]]
+    contexts: Mapping[str, Sequence[str]]
     required_fields: Sequence[str]
     due_format: str
     warn_window_days: int
@@ -67,17 +98,42 @@ class AuditConfig:
     delta_mode: bool
     pr_halo_lines: int
 
+    def __post_init__(self) -> None:
+        # Loaded configs are shared between callers, so the context globs are
+        # read-only too, like ``include`` and ``exclude``.
+        contexts = {name: tuple(globs) for name, globs in self.contexts.items()}
+        object.__setattr__(self, "contexts", MappingProxyType(contexts))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # mappingproxy cannot be pickled; worker processes get a plain dict,
+        # which __post_init__ wraps again.
+        values = tuple(
+            dict(self.contexts) if item.name == "contexts" else getattr(self, item.name)
+            for item in fields(self)
+        )
+        return (type(self), values)
+
     @classmethod
     def load(cls, path: Path = CONFIG_PATH) -> "AuditConfig":
         if not path.exists():
             raise PlaceholderAuditError(f"Configuration file not found: {path}")
+        stat = path.stat()
+        # Configs are frozen, so one parsed instance is shared until the file
+        # changes on disk.
+        return _load_config_cached(cls, path.resolve(), stat.st_mtime_ns, stat.st_size)
+
+    def make_evaluator(self) -> "PlaceholderEvaluator":
+        return make_evaluator(self)
+
+    @classmethod
+    def _parse(cls, path: Path) -> "AuditConfig":
         raw = load_yaml_config(path)
         try:
             thresholds = raw.get("age_threshold_days", {})
             return cls(
                 include=tuple(raw["include"]),
                 exclude=tuple(raw.get("exclude", ())),
-                contexts={k: tuple(v) for k, v in raw.get("contexts", {}).items()},
+                contexts=raw.get("contexts", {}),
                 required_fields=tuple(raw.get("required_fields", ())),
                 due_format=str(raw.get("due_format", "YYYY-MM-DD")),
                 warn_window_days=int(raw.get("warn_window_days", 7)),
@@ -95,35 +151,85 @@ class AuditConfig:
             ) from error
 
 
-@dataclass
+@lru_cache(maxsize=8)
+def _load_config_cached(
+    cls: type[AuditConfig], path: Path, mtime_ns: int, size: int
+) -> AuditConfig:
+    return cls._parse(path)
+
+
+@dataclass(slots=True)
 class DiffLine:
     old_number: Optional[int]
     new_number: Optional[int]
     symbol: str
 
 
-@dataclass
+class _AllAddedLines(Mapping[int, str]):
+    """Read-only ``{line: "+"}`` view over lines ``1..line_count``."""
+
+    __slots__ = ("_line_count",)
+
+    def __init__(self, line_count: int) -> None:
+        self._line_count = line_count
+
+    def __getitem__(self, line_number: int) -> str:
+        if 1 <= line_number <= self._line_count:
+            return "+"
+        raise KeyError(line_number)
+
+    def get(self, line_number: int, default: Optional[str] = None) -> Optional[str]:
+        return "+" if 1 <= line_number <= self._line_count else default
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(1, self._line_count + 1))
+
+    def __len__(self) -> int:
+        return self._line_count
+
+
+@dataclass(slots=True)
 class DiffFile:
     path: Path
+    # Kept for callers that build a DiffFile by hand; parse_diff() fills the
+    # line maps below directly instead of materialising DiffLines.
     lines: List[DiffLine] = field(default_factory=list)
     is_binary: bool = False
-
-    def new_line_numbers(self) -> Dict[int, str]:
-        mapping: Dict[int, str] = {}
+    # Decoded head content when it was already read, e.g. by a full scan.
+    content: Optional[str] = field(default=None, repr=False)
+    # Full scans treat every line as added without materialising DiffLines.
+    full_scan: bool = False
+    line_count: int = 0
+    new_lines: Dict[int, str] = field(default_factory=dict, repr=False)
+    old_lines: Dict[int, str] = field(default_factory=dict, repr=False)
+
+    @property
+    def posix(self) -> str:
+        return self.path.as_posix()
+
+    def new_line_numbers(self) -> Mapping[int, str]:
+        if self.full_scan:
+            return _AllAddedLines(self.line_count)
+        if not self.lines:
+            return self.new_lines
+        # Read ``lines`` on every call so appends after construction count.
+        mapping = dict(self.new_lines)
         for line in self.lines:
             if line.new_number is not None:
                 mapping[line.new_number] = line.symbol
         return mapping
 
     def old_line_numbers(self) -> Dict[int, str]:
-        mapping: Dict[int, str] = {}
+        if not self.lines:
+            return self.old_lines
+        mapping = dict(self.old_lines)
         for line in self.lines:
             if line.old_number is not None:
                 mapping[line.old_number] = line.symbol
         return mapping
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlaceholderRecord:
     marker: str
     attributes: Dict[str, str]
@@ -138,13 +244,23 @@ class PlaceholderRecord:
     suggested_fix: str
     expired: bool
     is_added_or_modified: bool
+    # Records are frozen, so the path is rendered once for every writer.
+    posix: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "posix", self.file_path.as_posix())
+
+    @property
+    def reason_text(self) -> str:
+        # Joined on access: ``reasons`` is a list and may still be extended.
+        return "; ".join(self.reasons)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "marker": self.marker,
             "attributes": self.attributes,
             "text": self.text,
-            "file_path": self.file_path.as_posix(),
+            "file_path": self.posix,
             "line_number": self.line_number,
             "context": self.context,
             "inside_fence": self.inside_fence,
@@ -157,7 +273,7 @@ class PlaceholderRecord:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditReport:
     findings: List[PlaceholderRecord]
     base_high_count: int
@@ -180,8 +296,10 @@ def run_git(args: Sequence[str], cwd: Optional[Path] = None) -> str:
 
 def load_yaml_config(path: Path) -> Dict[str, Any]:
     if _pyyaml is not None:
+        # libyaml's CSafeLoader is a drop-in for SafeLoader when PyYAML has it.
+        loader = getattr(_pyyaml, "CSafeLoader", _pyyaml.SafeLoader)
         with path.open("r", encoding="utf-8") as handle:
-            return _pyyaml.safe_load(handle)
+            return _pyyaml.load(handle, Loader=loader)
     if _RuamelYAML is not None:
         parser = _RuamelYAML(typ="safe")
         with path.open("r", encoding="utf-8") as handle:
@@ -192,8 +310,8 @@ def load_yaml_config(path: Path) -> Dict[str, Any]:
 
 
 def list_tracked_files() -> List[Path]:
-    output = run_git(["ls-files"])
-    return [Path(line) for line in output.splitlines() if line]
+    output = run_git(["ls-files", "-z"])
+    return [Path(name) for name in output.split("\0") if name]
 
 
 def parse_diff(base: str, halo: int) -> List[DiffFile]:
@@ -237,26 +355,21 @@ def parse_diff(base: str, halo: int) -> List[DiffFile]:
             plus_start, *_ = plus[1:].split(",")
             old_line = int(minus_start)
             new_line = int(plus_start)
-            current.lines.append(DiffLine(old_number=None, new_number=None, symbol="@"))
             continue
         if raw_line.startswith("+"):
-            symbol = "+"
-            current.lines.append(
-                DiffLine(old_number=None, new_number=new_line, symbol=symbol)
-            )
+            if new_line is not None:
+                current.new_lines[new_line] = "+"
             new_line = (new_line or 0) + 1
             continue
         if raw_line.startswith("-"):
-            symbol = "-"
-            current.lines.append(
-                DiffLine(old_number=old_line, new_number=None, symbol=symbol)
-            )
+            if old_line is not None:
+                current.old_lines[old_line] = "-"
             old_line = (old_line or 0) + 1
             continue
-        symbol = " "
-        current.lines.append(
-            DiffLine(old_number=old_line, new_number=new_line, symbol=symbol)
-        )
+        if new_line is not None:
+            current.new_lines[new_line] = " "
+        if old_line is not None:
+            current.old_lines[old_line] = " "
         old_line = (old_line or 0) + 1
         new_line = (new_line or 0) + 1
     if current:
@@ -267,52 +380,78 @@ def parse_diff(base: str, halo: int) -> List[DiffFile]:
 def build_full_scan_targets(config: AuditConfig) -> List[DiffFile]:
     files: List[DiffFile] = []
     for path in list_tracked_files():
-        if match_any(path, config.exclude):
+        posix = path.as_posix()
+        if match_any(path, config.exclude, posix=posix):
             continue
-        if config.include and not match_any(path, config.include):
+        if config.include and not match_any(path, config.include, posix=posix):
             continue
-        if not path.exists():
+        try:
+            data = path.read_bytes()
+        except OSError:
             continue
         try:
-            line_count = sum(1 for _ in path.read_text(encoding="utf-8").splitlines())
+            content = data.decode("utf-8")
         except UnicodeDecodeError:
             continue
-        diff_lines = [
-            DiffLine(old_number=None, new_number=index, symbol="+")
-            for index in range(1, line_count + 1)
-        ]
-        files.append(DiffFile(path=path, lines=diff_lines))
+        if _breaks_only_on_newlines(content):
+            line_count = data.count(b"\n") + (bool(data) and data[-1:] != b"\n")
+        else:
+            line_count = len(content.splitlines())
+        files.append(
+            DiffFile(
+                path=path,
+                content=content,
+                full_scan=True,
+                line_count=line_count,
+            )
+        )
     return files
 
 
-def match_any(path: Path, patterns: Sequence[str]) -> bool:
-    if not patterns:
-        return False
-    posix = path.as_posix()
+@lru_cache(maxsize=64)
+def _compile_globs(
+    patterns: Tuple[str, ...], *, strip_prefix: bool = False
+) -> Optional[re.Pattern[str]]:
+    """Fuse glob *patterns* into one alternation regex, cached per tuple.
+
+    With *strip_prefix*, ``**/`` patterns also contribute their un-prefixed
+    form so they match files at the repository root. Returns ``None`` when
+    there is nothing to match.
+    """
+
+    globs: List[str] = []
     for pattern in patterns:
-        if fnmatch.fnmatch(posix, pattern) or fnmatch.fnmatch(path.name, pattern):
-            return True
-        if pattern.startswith("**/") and (
-            fnmatch.fnmatch(posix, pattern[3:])
-            or fnmatch.fnmatch(path.name, pattern[3:])
-        ):
-            return True
-    return False
+        globs.append(pattern)
+        if strip_prefix and pattern.startswith("**/"):
+            globs.append(pattern[3:])
+    if not globs:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(glob)})" for glob in globs))
 
 
-def classify_context(path: Path, config: AuditConfig) -> str:
-    posix = path.as_posix()
+def match_any(
+    path: Path, patterns: Sequence[str], *, posix: Optional[str] = None
+) -> bool:
+    regex = _compile_globs(tuple(patterns), strip_prefix=True)
+    if regex is None:
+        return False
+    if posix is None:
+        posix = path.as_posix()
+    return bool(regex.match(posix) or regex.match(path.name))
+
+
+def classify_context(
+    path: Path, config: AuditConfig, *, posix: Optional[str] = None
+) -> str:
+    if posix is None:
+        posix = path.as_posix()
     preferred = ("tests", "docs")
-    for name in preferred:
-        for pattern in config.contexts.get(name, ()):  # type: ignore[arg-type]
-            if fnmatch.fnmatch(posix, pattern):
-                return name
-    for name, patterns in config.contexts.items():
-        if name in preferred:
-            continue
-        for pattern in patterns:
-            if fnmatch.fnmatch(posix, pattern):
-                return name
+    ordered = [name for name in preferred if name in config.contexts]
+    ordered += [name for name in config.contexts if name not in preferred]
+    for name in ordered:
+        regex = _compile_globs(tuple(config.contexts[name]))
+        if regex is not None and regex.match(posix):
+            return name
     return "prod_code"
 
 
@@ -324,34 +463,127 @@ def parse_attributes(raw: str) -> Dict[str, str]:
     return attributes
 
 
-def read_base_file(path: Path, base_ref: str) -> Optional[str]:
+class GitCatFileBatch:
+    """Read blobs through one long-running ``git cat-file --batch`` process.
+
+    The process is started on the first :meth:`fetch`, so scans that never
+    need base content do not spawn it. Use as a context manager, or call
+    :meth:`close`, to shut the pipe down.
+    """
+
+    def __init__(self, cwd: Optional[Path] = None) -> None:
+        self.cwd = cwd
+        self._process: Optional[subprocess.Popen[bytes]] = None
+
+    def __enter__(self) -> "GitCatFileBatch":
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def fetch(self, ref: str, path: str) -> Optional[str]:
+        """Return ``ref:path`` decoded as UTF-8, or ``None`` if it is not a blob."""
+
+        process = self._process
+        if process is None:
+            process = self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=str(self.cwd) if self.cwd else None,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        assert process.stdin is not None and process.stdout is not None
+        process.stdin.write(f"{ref}:{path}\n".encode("utf-8"))
+        process.stdin.flush()
+        # "<sha> <type> <size>" or "<spec> missing"/"<spec> ambiguous"; the
+        # spec echoes the path, so it may hold any number of spaces.
+        line = process.stdout.readline()
+        header = line.split()
+        if not header:
+            self.close()
+            return None
+        if line.endswith((b" missing\n", b" ambiguous\n")):
+            return None
+        if len(header) != 3 or not header[2].isdigit():
+            return None
+        size = int(header[2])
+        body = process.stdout.read(size)
+        process.stdout.read(1)  # Trailing newline after the object.
+        if header[1] != b"blob":
+            return None
+        return body.decode("utf-8", "replace")
+
+    def close(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if process.stdin is not None:
+            process.stdin.close()
+        if process.stdout is not None:
+            process.stdout.close()
+        process.wait()
+
+
+def read_base_file(
+    path: Path, base_ref: str, reader: Optional[GitCatFileBatch] = None
+) -> Optional[str]:
     git_path = path.as_posix()
+    if reader is not None and "\n" not in git_path:
+        return reader.fetch(base_ref, git_path)
     try:
         return run_git(["show", f"{base_ref}:{git_path}"])
     except subprocess.CalledProcessError:
         return None
 
 
-def compute_age_days(path: Path, line_number: int) -> Optional[int]:
+def blame_file(path: Path) -> Dict[int, int]:
+    """Return the age in days of every line of *path* at HEAD.
+
+    A single ``git blame --incremental`` covers the whole file. It reports
+    line ranges per commit and each commit's metadata only once, so ages are
+    computed per commit and then spread over its ranges. An empty mapping is
+    returned when git cannot blame the file.
+    """
+
     try:
         blame_output = run_git(
-            [
-                "blame",
-                "--line-porcelain",
-                f"-L{line_number},{line_number}",
-                "HEAD",
-                path.as_posix(),
-            ]
+            ["blame", "--incremental", "HEAD", "--", path.as_posix()]
         )
     except subprocess.CalledProcessError:
-        return None
+        return {}
+    now = dt.datetime.now(tz=dt.timezone.utc)
+    commit_ages: Dict[str, int] = {}
+    ranges: List[Tuple[str, int, int]] = []
     for line in blame_output.splitlines():
-        if line.startswith("author-time "):
+        header = _BLAME_HEADER.match(line)
+        if header:
+            ranges.append((header.group(1), int(header.group(2)), int(header.group(3))))
+        elif line.startswith("author-time ") and ranges:
             timestamp = int(line.split()[1])
             authored = dt.datetime.fromtimestamp(timestamp, tz=dt.timezone.utc)
-            delta = dt.datetime.now(tz=dt.timezone.utc) - authored
-            return delta.days
-    return None
+            commit_ages[ranges[-1][0]] = (now - authored).days
+    ages: Dict[int, int] = {}
+    for sha, start, count in ranges:
+        age = commit_ages.get(sha)
+        if age is not None:
+            ages.update(dict.fromkeys(range(start, start + count), age))
+    return ages
+
+
+def compute_age_days(
+    path: Path,
+    line_number: int,
+    blame_cache: Optional[Dict[Path, Dict[int, int]]] = None,
+) -> Optional[int]:
+    """Look up a line's age, blaming *path* once per *blame_cache*."""
+
+    if blame_cache is None:
+        return blame_file(path).get(line_number)
+    ages = blame_cache.get(path)
+    if ages is None:
+        ages = blame_cache[path] = blame_file(path)
+    return ages.get(line_number)
 
 
 def validate_issue(value: Optional[str]) -> bool:
@@ -362,6 +594,9 @@ def validate_issue(value: Optional[str]) -> bool:
     return bool(re.match(r"https?://", value))
 
 
+PlaceholderEvaluator = Callable[..., Tuple[str, float, List[str], str, bool]]
+
+
 def evaluate_placeholder(
     marker: str,
     attributes: Dict[str, str],
@@ -370,94 +605,139 @@ def evaluate_placeholder(
     config: AuditConfig,
     age_days: Optional[int],
     inside_fence: bool,
+    today: Optional[dt.date] = None,
 ) -> Tuple[str, float, List[str], str, bool]:
-    reasons: List[str] = []
-    expired = False
-    due_within_window = False
-    due_str = attributes.get("due")
-    if due_str:
-        try:
-            due_date = dt.datetime.strptime(due_str, "%Y-%m-%d").date()
-            if due_date < dt.date.today():
-                expired = True
-                reasons.append("due date expired")
-            elif (due_date - dt.date.today()).days <= config.warn_window_days:
-                due_within_window = True
-                reasons.append("due within warn window")
-        except ValueError:
-            reasons.append("invalid due format")
-    completeness_weight = 0.0
-    missing_fields = [
-        field for field in config.required_fields if field not in attributes
-    ]
-    if marker == "TBD" and context in _ALLOWED_DOC_TBD_CONTEXTS:
-        if not validate_issue(attributes.get("issue")):
-            reasons.append("docs TBD requires linked issue")
-            completeness_weight = 1.0
+    return make_evaluator(config)(
+        marker=marker,
+        attributes=attributes,
+        text=text,
+        context=context,
+        age_days=age_days,
+        inside_fence=inside_fence,
+        today=today,
+    )
+
+
+def make_evaluator(config: AuditConfig) -> PlaceholderEvaluator:
+    """Return :func:`evaluate_placeholder` with *config* bound.
+
+    The settings it consults are read once into the closure, so scoring a
+    placeholder does no attribute lookups on the configuration.
+    """
+
+    required_fields = tuple(config.required_fields)
+    warn_window_days = config.warn_window_days
+    warn_age = config.age_threshold_days.warn
+    high_age = config.age_threshold_days.high
+
+    def evaluate(
+        marker: str,
+        attributes: Dict[str, str],
+        text: str,
+        context: str,
+        age_days: Optional[int],
+        inside_fence: bool,
+        today: Optional[dt.date] = None,
+    ) -> Tuple[str, float, List[str], str, bool]:
+        reasons: List[str] = []
+        expired = False
+        due_within_window = False
+        due_str = attributes.get("due")
+        if due_str:
+            if today is None:
+                today = dt.date.today()
+            try:
+                due_date = dt.datetime.strptime(due_str, "%Y-%m-%d").date()
+                if due_date < today:
+                    expired = True
+                    reasons.append("due date expired")
+                elif (due_date - today).days <= warn_window_days:
+                    due_within_window = True
+                    reasons.append("due within warn window")
+            except ValueError:
+                reasons.append("invalid due format")
+        completeness_weight = 0.0
+        missing_fields = [field for field in required_fields if field not in attributes]
+        if marker == "TBD" and context in _ALLOWED_DOC_TBD_CONTEXTS:
+            if not validate_issue(attributes.get("issue")):
+                reasons.append("docs TBD requires linked issue")
+                completeness_weight = 1.0
+            else:
+                completeness_weight = 0.0
         else:
-            completeness_weight = 0.0
-    else:
-        missing = len(missing_fields)
-        if missing == 1:
-            completeness_weight = 0.5
-            reasons.append(f"missing {missing_fields[0]}")
-        elif missing >= 2:
-            completeness_weight = 1.0
-            reasons.append(f"missing fields: {', '.join(missing_fields)}")
-    if "issue" in attributes and not validate_issue(attributes.get("issue")):
-        reasons.append("issue must be #id or URL")
-        completeness_weight = max(completeness_weight, 0.5)
-    context_weight = CONTEXT_WEIGHTS.get(context, CONTEXT_WEIGHTS["prod_code"])
-    age_factor = 1.0
-    if age_days is not None:
-        if age_days > config.age_threshold_days.high:
-            age_factor += 0.5
-            reasons.append("age > 90d")
-        elif age_days > config.age_threshold_days.warn:
-            age_factor += 0.25
-            reasons.append("age > 30d")
-    if completeness_weight == 0.0 and marker != "TBD":
-        age_factor = 0.0
-    score = context_weight * completeness_weight * age_factor
-    severity = "LOW"
-    if expired:
-        severity = "HIGH"
-    else:
-        if score >= 1.25:
+            missing = len(missing_fields)
+            if missing == 1:
+                completeness_weight = 0.5
+                reasons.append(f"missing {missing_fields[0]}")
+            elif missing >= 2:
+                completeness_weight = 1.0
+                reasons.append(f"missing fields: {', '.join(missing_fields)}")
+        if "issue" in attributes and not validate_issue(attributes.get("issue")):
+            reasons.append("issue must be #id or URL")
+            completeness_weight = max(completeness_weight, 0.5)
+        context_weight = CONTEXT_WEIGHTS.get(context, CONTEXT_WEIGHTS["prod_code"])
+        age_factor = 1.0
+        if age_days is not None:
+            if age_days > high_age:
+                age_factor += 0.5
+                reasons.append("age > 90d")
+            elif age_days > warn_age:
+                age_factor += 0.25
+                reasons.append("age > 30d")
+        if completeness_weight == 0.0 and marker != "TBD":
+            age_factor = 0.0
+        score = context_weight * completeness_weight * age_factor
+        severity = "LOW"
+        if expired:
             severity = "HIGH"
-        elif score >= 0.75:
-            severity = "MED"
-        if due_within_window and severity == "LOW":
-            severity = "MED"
-        if completeness_weight > 0.0:
-            if context == "prod_code":
+        else:
+            if score >= 1.25:
                 severity = "HIGH"
-            elif context == "tests":
+            elif score >= 0.75:
                 severity = "MED"
-            elif context == "docs":
+            if due_within_window and severity == "LOW":
                 severity = "MED"
-    if (
-        marker == "TBD"
-        and context in _ALLOWED_DOC_TBD_CONTEXTS
-        and validate_issue(attributes.get("issue"))
-    ):
-        severity = "LOW"
-    suggested_fix = "Ensure owner/due/issue metadata is complete"
-    if marker == "TBD" and context in _ALLOWED_DOC_TBD_CONTEXTS:
-        suggested_fix = "Keep TBD entries inside fenced blocks with linked issue"
-    return severity, score, reasons, suggested_fix, expired
+            if completeness_weight > 0.0:
+                if context == "prod_code":
+                    severity = "HIGH"
+                elif context == "tests":
+                    severity = "MED"
+                elif context == "docs":
+                    severity = "MED"
+        if (
+            marker == "TBD"
+            and context in _ALLOWED_DOC_TBD_CONTEXTS
+            and validate_issue(attributes.get("issue"))
+        ):
+            severity = "LOW"
+        suggested_fix = "Ensure owner/due/issue metadata is complete"
+        if marker == "TBD" and context in _ALLOWED_DOC_TBD_CONTEXTS:
+            suggested_fix = "Keep TBD entries inside fenced blocks with linked issue"
+        return severity, score, reasons, suggested_fix, expired
+
+    return evaluate
 
 
 def detect_placeholders(
     path: Path,
     content: str,
-    new_lines: Dict[int, str],
+    new_lines: Mapping[int, str],
     context: str,
     config: AuditConfig,
     inside_fence_lines: Set[int],
+    blame_cache: Optional[Dict[Path, Dict[int, int]]] = None,
+    evaluator: Optional[PlaceholderEvaluator] = None,
 ) -> List[PlaceholderRecord]:
     findings: List[PlaceholderRecord] = []
-    for idx, line in enumerate(content.splitlines(), start=1):
+    if not _contains_marker(content):
+        return findings
+    if blame_cache is None:
+        blame_cache = {}
+    if evaluator is None:
+        evaluator = config.make_evaluator()
+    # Due dates of every placeholder in the file are judged against one day.
+    today = dt.date.today()
+    for idx, line in _candidate_lines(content):
         symbol = new_lines.get(idx)
         if symbol is None:
             continue
@@ -470,15 +750,15 @@ def detect_placeholders(
         if path.suffix.lower() == ".md" and idx in inside_fence_lines:
             if validate_issue(attrs.get("issue")):
                 continue
-        age_days = compute_age_days(path, idx)
-        severity, score, reasons, suggested_fix, expired = evaluate_placeholder(
+        age_days = compute_age_days(path, idx, blame_cache)
+        severity, score, reasons, suggested_fix, expired = evaluator(
             marker=marker,
             attributes=attrs,
             text=text,
             context=context,
-            config=config,
             age_days=age_days,
             inside_fence=idx in inside_fence_lines,
+            today=today,
         )
         findings.append(
             PlaceholderRecord(
@@ -500,7 +780,98 @@ def detect_placeholders(
     return findings
 
 
+def _breaks_only_on_newlines(content: str) -> bool:
+    """Return whether ``str.splitlines()`` would split *content* only at ``\n``."""
+
+    return content.count("\r") == content.count("\r\n") and not any(
+        brk in content for brk in _EXTRA_LINE_BREAKS
+    )
+
+
+def _contains_marker(content: str) -> bool:
+    # One C-level substring scan per marker; most files contain none of them.
+    return any(marker in content for marker in _MARKERS)
+
+
+def _candidate_lines(content: str) -> Iterator[Tuple[int, str]]:
+    """Yield ``(line_number, line)`` for lines containing a placeholder marker.
+
+    Line numbers follow ``str.splitlines()``. When the content only breaks
+    lines on ``\n``/``\r\n`` the markers are located with ``str.find`` and
+    only their lines are sliced out; otherwise every line is checked.
+    """
+
+    if not _breaks_only_on_newlines(content):
+        for idx, line in enumerate(content.splitlines(), start=1):
+            if any(marker in line for marker in _MARKERS):
+                yield idx, line
+        return
+    positions: List[int] = []
+    for marker in _MARKERS:
+        position = content.find(marker)
+        while position != -1:
+            positions.append(position)
+            position = content.find(marker, position + len(marker))
+    line_number = 1
+    counted_to = 0
+    line_end = -1
+    for start in sorted(positions):
+        if start < line_end:
+            continue  # Another marker on a line that was already yielded.
+        line_number += content.count("\n", counted_to, start)
+        counted_to = start
+        line_start = content.rfind("\n", 0, start) + 1
+        line_end = content.find("\n", start)
+        if line_end == -1:
+            line_end = len(content)
+        line = content[line_start:line_end]
+        yield line_number, line[:-1] if line.endswith("\r") else line
+
+
 def track_fences(content: str) -> Set[int]:
+    """Return the line numbers enclosed by ``` or ~~~ fences.
+
+    Fence lines are located with ``str.find`` when the content only breaks
+    lines on ``\n``/``\r\n``; other content is walked line by line.
+    """
+
+    if not _breaks_only_on_newlines(content):
+        return _track_fences_by_line(content)
+    positions: List[int] = []
+    for delimiter in _FENCE_DELIMITERS:
+        position = content.find(delimiter)
+        while position != -1:
+            positions.append(position)
+            position = content.find(delimiter, position + 1)
+    fence_lines: Set[int] = set()
+    inside = False
+    fence_delimiter: Optional[str] = None
+    line_number = 1
+    counted_to = 0
+    previous_fence = 0
+    for start in sorted(positions):
+        line_start = content.rfind("\n", 0, start) + 1
+        if content[line_start:start].strip():
+            continue  # Not the first non-blank text on its line.
+        line_number += content.count("\n", counted_to, start)
+        counted_to = start
+        if inside:
+            fence_lines.update(range(previous_fence + 1, line_number))
+        delimiter = content[start : start + 3]
+        if inside and fence_delimiter == delimiter:
+            inside = False
+            fence_delimiter = None
+        else:
+            inside = True
+            fence_delimiter = delimiter
+        previous_fence = line_number
+    if inside:
+        last_line = content.count("\n") + (not content.endswith("\n"))
+        fence_lines.update(range(previous_fence + 1, last_line + 1))
+    return fence_lines
+
+
+def _track_fences_by_line(content: str) -> Set[int]:
     inside = False
     fence_lines: Set[int] = set()
     fence_delimiter: Optional[str] = None
@@ -521,16 +892,18 @@ def track_fences(content: str) -> Set[int]:
 
 
 def summarize(findings: Sequence[PlaceholderRecord]) -> Dict[str, Any]:
-    summary: Dict[str, Any] = {
+    by_severity = {"HIGH": 0, "MED": 0, "LOW": 0}
+    high_legacy: List[PlaceholderRecord] = []
+    for finding in findings:
+        severity = finding.severity
+        by_severity[severity] += 1
+        if severity == "HIGH" and not finding.is_added_or_modified:
+            high_legacy.append(finding)
+    return {
         "total": len(findings),
-        "by_severity": {"HIGH": 0, "MED": 0, "LOW": 0},
-        "high_legacy": [],
+        "by_severity": by_severity,
+        "high_legacy": high_legacy,
     }
-    for finding in findings:
-        summary["by_severity"][finding.severity] += 1
-        if finding.severity == "HIGH" and not finding.is_added_or_modified:
-            summary["high_legacy"].append(finding)
-    return summary
 
 
 def build_sarif(findings: Sequence[PlaceholderRecord]) -> Dict[str, Any]:
@@ -541,11 +914,11 @@ def build_sarif(findings: Sequence[PlaceholderRecord]) -> Dict[str, Any]:
             {
                 "ruleId": rule_id,
                 "level": SARIF_SEVERITIES.get(finding.severity, "note"),
-                "message": {"text": "; ".join(finding.reasons) or finding.text},
+                "message": {"text": finding.reason_text or finding.text},
                 "locations": [
                     {
                         "physicalLocation": {
-                            "artifactLocation": {"uri": finding.file_path.as_posix()},
+                            "artifactLocation": {"uri": finding.posix},
                             "region": {
                                 "startLine": finding.line_number,
                                 "startColumn": 1,
@@ -580,28 +953,37 @@ def build_sarif(findings: Sequence[PlaceholderRecord]) -> Dict[str, Any]:
 
 
 def format_table(findings: Sequence[PlaceholderRecord]) -> str:
-    headers = ["File", "Line", "Marker", "Severity", "Reason"]
-    rows: List[List[str]] = [headers]
-    for finding in findings:
-        reason = "; ".join(finding.reasons) or ""
-        rows.append(
-            [
-                finding.file_path.as_posix(),
-                str(finding.line_number),
-                finding.marker,
-                finding.severity,
-                reason,
-            ]
+    headers = ("File", "Line", "Marker", "Severity", "Reason")
+    rows: List[Tuple[str, ...]] = [headers]
+    rows.extend(
+        (
+            finding.posix,
+            str(finding.line_number),
+            finding.marker,
+            finding.severity,
+            finding.reason_text,
         )
-    widths = [max(len(row[i]) for row in rows) for i in range(len(headers))]
-    lines: List[str] = []
-    for idx, row in enumerate(rows):
-        formatted = " | ".join(value.ljust(widths[i]) for i, value in enumerate(row))
-        lines.append(formatted)
-        if idx == 0:
-            separator = "-+-".join("-" * width for width in widths)
-            lines.append(separator)
-    return "\n".join(lines)
+        for finding in findings
+    )
+    widths = [max(map(len, column)) for column in zip(*rows, strict=True)]
+    # One format spec pads every cell of a row in a single call.
+    row_fmt = " | ".join(f"{{:<{width}}}" for width in widths)
+    separator = "-+-".join("-" * width for width in widths)
+    return "\n".join(
+        [
+            row_fmt.format(*headers),
+            separator,
+            *(row_fmt.format(*row) for row in rows[1:]),
+        ]
+    )
+
+
+def _dump_json(payload: Dict[str, Any]) -> bytes:
+    """Serialize *payload* as indented JSON bytes, via orjson when installed."""
+
+    if _orjson is not None:
+        return _orjson.dumps(payload, option=_orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
 
 
 def build_pr_comment(findings: Sequence[PlaceholderRecord]) -> str:
@@ -609,9 +991,9 @@ def build_pr_comment(findings: Sequence[PlaceholderRecord]) -> str:
     separator = "| --- | --- | --- | --- | --- |"
     rows = [header, separator]
     for finding in findings[:25]:
-        reason = "; ".join(finding.reasons) or "Review placeholder"
+        reason = finding.reason_text or "Review placeholder"
         cell = (
-            f"| `{finding.file_path.as_posix()}:{finding.line_number}` | {finding.marker} | "
+            f"| `{finding.posix}:{finding.line_number}` | {finding.marker} | "
             f"{finding.severity} | {reason} | {finding.suggested_fix} |"
         )
         rows.append(cell)
@@ -628,67 +1010,129 @@ def compute_delta(
 ) -> Tuple[int, int, int]:
     head_high = count_high(head_findings)
     base_high = count_high(base_findings)
-    net_new = max(head_high - base_high, 0)
-    return base_high, head_high, net_new
+    return base_high, head_high, _net_new_high(head_high, base_high)
 
 
-def scan_files(
-    diff_files: Sequence[DiffFile],
+def _net_new_high(head_high: int, base_high: int) -> int:
+    """Return how many more HIGH findings the head has than the base."""
+
+    return max(head_high - base_high, 0)
+
+
+def _scan_one(
+    diff_file: DiffFile,
     config: AuditConfig,
     base_ref: str,
-) -> AuditReport:
-    head_findings: List[PlaceholderRecord] = []
-    base_findings: List[PlaceholderRecord] = []
-    for diff_file in diff_files:
-        if diff_file.is_binary or not diff_file.path:
-            continue
-        path = diff_file.path
-        if match_any(path, config.exclude):
-            continue
-        if config.include and not match_any(path, config.include):
-            continue
-        context = classify_context(path, config)
-        new_lines = diff_file.new_line_numbers()
-        if not new_lines:
-            continue
+    base_reader: Optional[GitCatFileBatch] = None,
+) -> Tuple[List[PlaceholderRecord], List[PlaceholderRecord]]:
+    """Return the head and base findings for a single diff entry."""
+
+    if diff_file.is_binary or not diff_file.path:
+        return [], []
+    path = diff_file.path
+    posix = diff_file.posix
+    if match_any(path, config.exclude, posix=posix):
+        return [], []
+    if config.include and not match_any(path, config.include, posix=posix):
+        return [], []
+    context = classify_context(path, config, posix=posix)
+    new_lines = diff_file.new_line_numbers()
+    if not new_lines:
+        return [], []
+    content = diff_file.content
+    if content is None:
         content = path.read_text(encoding="utf-8") if path.exists() else ""
-        fence_lines = track_fences(content)
-        head_findings.extend(
-            detect_placeholders(
+    # Head and base lookups both blame HEAD, so the path is blamed once.
+    blame_cache: Dict[Path, Dict[int, int]] = {}
+    evaluator = config.make_evaluator()
+    head_findings = detect_placeholders(
+        path=path,
+        content=content,
+        new_lines=new_lines,
+        context=context,
+        config=config,
+        inside_fence_lines=_fence_lines_if_needed(content),
+        blame_cache=blame_cache,
+        evaluator=evaluator,
+    )
+    base_findings: List[PlaceholderRecord] = []
+    old_lines = diff_file.old_line_numbers()
+    if old_lines:
+        base_content = read_base_file(
+            path, base_ref, base_reader or _worker_base_reader
+        )
+        if base_content:
+            base_findings = detect_placeholders(
                 path=path,
-                content=content,
-                new_lines=new_lines,
+                content=base_content,
+                new_lines=old_lines,
                 context=context,
                 config=config,
-                inside_fence_lines=fence_lines,
+                inside_fence_lines=_fence_lines_if_needed(base_content),
+                blame_cache=blame_cache,
+                evaluator=evaluator,
             )
-        )
-        old_lines = diff_file.old_line_numbers()
-        if old_lines:
-            base_content = read_base_file(path, base_ref)
-            if base_content:
-                fence_old = track_fences(base_content)
-                base_findings.extend(
-                    detect_placeholders(
-                        path=path,
-                        content=base_content,
-                        new_lines=old_lines,
-                        context=context,
-                        config=config,
-                        inside_fence_lines=fence_old,
-                    )
+    return head_findings, base_findings
+
+
+def _fence_lines_if_needed(content: str) -> Set[int]:
+    # Fence lines are only consulted for placeholder hits, so files without a
+    # marker (most of them) skip the line-by-line fence walk.
+    if _contains_marker(content):
+        return track_fences(content)
+    return set()
+
+
+# Base-content reader of a scan_files() pool worker; the pipe closes with it.
+_worker_base_reader: Optional[GitCatFileBatch] = None
+
+
+def _init_scan_worker() -> None:
+    global _worker_base_reader
+    _worker_base_reader = GitCatFileBatch()
+
+
+def scan_files(
+    diff_files: Sequence[DiffFile],
+    config: AuditConfig,
+    base_ref: str,
+) -> AuditReport:
+    head_findings: List[PlaceholderRecord] = []
+    if len(diff_files) > _PARALLEL_SCAN_MIN_FILES and (os.cpu_count() or 1) > 1:
+        # Files are independent; a pool only pays off once its start-up cost
+        # is spread over enough of them. map() keeps the input order.
+        with ProcessPoolExecutor(initializer=_init_scan_worker) as executor:
+            results = list(
+                executor.map(
+                    _scan_one,
+                    diff_files,
+                    repeat(config),
+                    repeat(base_ref),
+                    chunksize=8,
                 )
-    base_high, head_high, net_new = compute_delta(head_findings, base_findings)
-    expired_blockers = sum(
-        1
-        for finding in head_findings
-        if finding.expired and finding.is_added_or_modified
-    )
+            )
+    else:
+        with GitCatFileBatch() as base_reader:
+            results = [
+                _scan_one(diff_file, config, base_ref, base_reader)
+                for diff_file in diff_files
+            ]
+    # Counts are tallied while the per-file results are merged, so neither
+    # finding list is walked again afterwards.
+    head_high = base_high = expired_blockers = 0
+    for head, base in results:
+        head_findings.extend(head)
+        for finding in head:
+            if finding.severity == "HIGH":
+                head_high += 1
+            if finding.expired and finding.is_added_or_modified:
+                expired_blockers += 1
+        base_high += count_high(base)
     return AuditReport(
         findings=head_findings,
         base_high_count=base_high,
         head_high_count=head_high,
-        net_new_high=net_new,
+        net_new_high=_net_new_high(head_high, base_high),
         expired_blockers=expired_blockers,
     )
 
@@ -726,10 +1170,7 @@ def run_audit(args: argparse.Namespace) -> int:
                 )
             if args.sarif:
                 empty = build_sarif([])
-                Path(args.sarif).write_text(
-                    json.dumps(empty, indent=2),
-                    encoding="utf-8",
-                )
+                Path(args.sarif).write_bytes(_dump_json(empty))
             return 0
     else:
         diff_files = build_full_scan_targets(config)
@@ -748,13 +1189,12 @@ def run_audit(args: argparse.Namespace) -> int:
         print(
             "Legacy HIGH (no fail): "
             + ", ".join(
-                f"{item.file_path.as_posix()}:{item.line_number}"
-                for item in summary["high_legacy"]
+                f"{item.posix}:{item.line_number}" for item in summary["high_legacy"]
             )
         )
     if args.sarif:
         sarif_doc = build_sarif(report.findings)
-        Path(args.sarif).write_text(json.dumps(sarif_doc, indent=2), encoding="utf-8")
+        Path(args.sarif).write_bytes(_dump_json(sarif_doc))
     if args.comment:
         Path(args.comment).write_text(
             build_pr_comment(report.findings), encoding="utf-8"
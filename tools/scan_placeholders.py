@@ -4,23 +4,44 @@
 from __future__ import annotations
 
 import argparse
+import bisect
 import csv
+import datetime as dt
 import json
 import os
 import re
+import sqlite3
 import subprocess
 import sys
+import time
 from collections import Counter, defaultdict
-from dataclasses import dataclass
-from hashlib import sha256
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import cached_property, lru_cache
+from hashlib import blake2b
+from itertools import repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 try:  # pragma: no cover - optional dependency
     import yaml  # type: ignore[import-not-found]
 except ModuleNotFoundError:  # pragma: no cover - exercised in tests
     yaml = None  # type: ignore[assignment]
 
+try:  # pragma: no cover - optional dependency
+    import orjson as _orjson
+except ModuleNotFoundError:  # pragma: no cover - stdlib json is the fallback
+    _orjson = None
+
+try:  # Python 3.11+
+    from re import _parser as _regex_parser
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_parse as _regex_parser  # type: ignore[no-redef]
+
+# libyaml's CSafeLoader is a drop-in for SafeLoader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
 DEFAULT_EXTENSIONS = {
     ".py",
     ".md",
@@ -74,21 +95,31 @@ SEVERITY_BY_EXT = {
     "low": {".md", ".rst", ".txt"},
 }
 
+# Extension -> severity; built in reverse so the earlier, higher severity wins.
+_EXT_TO_SEV = {
+    ext: severity
+    for severity, exts in reversed(SEVERITY_BY_EXT.items())
+    for ext in exts
+}
+
+# scan_repository fans out to worker processes above this many uncached files.
+_PARALLEL_SCAN_MIN_FILES = 32
+
 GIT_BLAME_CACHE: Dict[Tuple[Path, int, int], Tuple[str, str]] = {}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Pattern:
     tag: str
     kind: str
     regex: str
     description: str
     suggested_fix: str
-    flags: Sequence[str]
+    flags: Tuple[str, ...]
     compiled: re.Pattern
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Finding:
     tag: str
     kind: str
@@ -138,6 +169,11 @@ def parse_flags(flag_names: Sequence[str]) -> int:
 def _parse_inline_list(value: str) -> List[Any]:
     if value == "[]":
         return []
+    if '"' not in value and "'" not in value:
+        # Without quotes every comma separates items.
+        return [
+            _coerce_scalar(token.strip()) for token in value.split(",") if token.strip()
+        ]
     items: List[str] = []
     buffer = ""
     in_quote = False
@@ -180,10 +216,10 @@ def _fallback_yaml_load(text: str) -> Dict[str, Any]:
     current_list: List[Dict[str, Any]] | None = None
     current_item: Dict[str, Any] | None = None
     for raw_line in text.splitlines():
-        if not raw_line.strip() or raw_line.lstrip().startswith("#"):
+        line = raw_line.strip()
+        if not line or line[0] == "#":
             continue
         indent = len(raw_line) - len(raw_line.lstrip(" "))
-        line = raw_line.strip()
         if indent == 0:
             if ":" not in line:
                 continue
@@ -221,30 +257,189 @@ def _fallback_yaml_load(text: str) -> Dict[str, Any]:
 def _load_patterns_data(pattern_path: Path) -> Dict[str, Any]:
     text = pattern_path.read_text(encoding="utf-8")
     if yaml is not None:
-        return yaml.safe_load(text) or {}
+        return yaml.load(text, Loader=_YAML_LOADER) or {}
     return _fallback_yaml_load(text)
 
 
-def load_patterns(pattern_path: Path) -> List[Pattern]:
+def _pattern_entries(pattern_path: Path) -> List[Dict[str, Any]]:
     data = _load_patterns_data(pattern_path)
+    return [
+        {
+            "tag": entry["tag"],
+            "kind": entry["kind"],
+            "regex": entry["regex"],
+            "description": entry.get("description", ""),
+            "suggested_fix": entry.get("suggested_fix", ""),
+            "flags": list(entry.get("flags", [])),
+        }
+        for entry in data.get("patterns", [])
+    ]
+
+
+def _compile_patterns(entries: Iterable[Dict[str, Any]]) -> List[Pattern]:
     patterns = []
-    for entry in data.get("patterns", []):
-        flags = entry.get("flags", [])
-        compiled = re.compile(entry["regex"], parse_flags(flags))
+    for entry in entries:
+        flags = tuple(entry["flags"])
         patterns.append(
             Pattern(
                 tag=entry["tag"],
                 kind=entry["kind"],
                 regex=entry["regex"],
-                description=entry.get("description", ""),
-                suggested_fix=entry.get("suggested_fix", ""),
+                description=entry["description"],
+                suggested_fix=entry["suggested_fix"],
                 flags=flags,
-                compiled=compiled,
+                compiled=re.compile(entry["regex"], parse_flags(flags)),
             )
         )
     return patterns
 
 
+def load_patterns(pattern_path: Path) -> List[Pattern]:
+    return _compile_patterns(_pattern_entries(pattern_path))
+
+
+def _pattern_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "scan_placeholders"
+
+
+def load_patterns_cached(
+    pattern_path: Path, cache_dir: Optional[Path] = None
+) -> List[Pattern]:
+    """Like :func:`load_patterns`, reusing parsed entries while the file is unchanged.
+
+    Each pattern file has one JSON file under ``cache_dir`` (default
+    ``$XDG_CACHE_HOME/scan_placeholders``), named after its path and stamped
+    with the file's mtime and size. It holds only the raw pattern fields, so
+    a hit skips reading and parsing the YAML but still compiles the regexes.
+    A missing, unreadable or malformed cache entry falls back to a plain load.
+    """
+
+    cache_dir = cache_dir if cache_dir is not None else _pattern_cache_dir()
+    stat = pattern_path.stat()
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    name = blake2b(
+        str(pattern_path.resolve()).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    cache_file = cache_dir / f"{name}.json"
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        if cached["stamp"] == stamp:
+            return _compile_patterns(cached["patterns"])
+    except (OSError, ValueError, KeyError, TypeError, re.error):
+        pass
+    entries = _pattern_entries(pattern_path)
+    patterns = _compile_patterns(entries)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        partial = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        partial.write_text(
+            json.dumps({"stamp": stamp, "patterns": entries}), encoding="utf-8"
+        )
+        os.replace(partial, cache_file)
+    except OSError:
+        pass
+    return patterns
+
+
+_WORD_REGEX = re.compile(r"^\\b(\w+)\\b$")
+
+# Non-ASCII characters that IGNORECASE matches against an ASCII letter but
+# that str.lower() does not map onto it.
+_ASCII_CASE_TWINS = (("\u0130", "i"), ("\u0131", "i"), ("\u017f", "s"))
+
+ScanPlan = Tuple[Tuple[re.Pattern, Tuple[int, ...], Tuple[str, ...], bool], ...]
+
+
+def required_literal(compiled: re.Pattern) -> str:
+    """Return the longest literal every match of ``compiled`` must contain.
+
+    Only top-level literal runs count; groups, classes and repeats end a run.
+    The literal is lowercased for IGNORECASE patterns, and ``""`` means none
+    could be extracted.
+    """
+
+    try:
+        parsed = _regex_parser.parse(compiled.pattern, compiled.flags)
+    except Exception:  # pragma: no cover - private parser API changed
+        return ""
+    best = run = ""
+    for op, arg in parsed:
+        if op == _regex_parser.LITERAL:
+            run += chr(arg)
+        elif op != _regex_parser.AT:
+            best, run = max(best, run, key=len), ""
+    best = max(best, run, key=len)
+    if compiled.flags & re.IGNORECASE:
+        return best.lower() if best.isascii() else ""
+    return best
+
+
+def lower_for_literals(text: str) -> str:
+    """Lowercase ``text`` so IGNORECASE literals can be found with ``in``."""
+
+    if not text.isascii():
+        for twin, letter in _ASCII_CASE_TWINS:
+            if twin in text:
+                text = text.replace(twin, letter)
+    return text.lower()
+
+
+@lru_cache(maxsize=8)
+def scan_plan(patterns: Tuple[Pattern, ...]) -> ScanPlan:
+    """Group ``patterns`` into the regexes :func:`detect_patterns` runs.
+
+    Whole-word literals such as ``\\bTODO\\b`` that share flags are folded
+    into one ``\\b(?:(?P<p0>TODO)|(?P<p1>FIXME)|...)\\b`` regex: a word can
+    only match where no other word does, so one pass finds exactly what the
+    separate patterns would, and ``match.lastgroup`` names the pattern.
+    Every other pattern keeps its own compiled regex.
+
+    Each entry also lists the literals one of which must occur in the text
+    for the regex to match (none when unknown) and whether they are lowercase
+    IGNORECASE literals, so files without them skip the regex engine.
+    """
+
+    words: Dict[int, List[Tuple[int, str]]] = defaultdict(list)
+    seen: set = set()
+    plan: List[Tuple[re.Pattern, Tuple[int, ...], Tuple[str, ...], bool]] = []
+
+    def add_single(index: int) -> None:
+        compiled = patterns[index].compiled
+        literal = required_literal(compiled)
+        ignorecase = bool(compiled.flags & re.IGNORECASE)
+        plan.append((compiled, (index,), (literal,) if literal else (), ignorecase))
+
+    for index, pattern in enumerate(patterns):
+        flags = pattern.compiled.flags
+        word = _WORD_REGEX.match(pattern.regex)
+        key = None
+        if word is not None:
+            text = word.group(1)
+            key = (flags, text.lower() if flags & re.IGNORECASE else text)
+        if key is None or key in seen:
+            add_single(index)
+            continue
+        seen.add(key)
+        words[flags].append((index, word.group(1)))
+    for flags, members in words.items():
+        if len(members) == 1:
+            add_single(members[0][0])
+            continue
+        alternatives = "|".join(f"(?P<p{index}>{text})" for index, text in members)
+        ignorecase = bool(flags & re.IGNORECASE)
+        literals = tuple(text.lower() if ignorecase else text for _, text in members)
+        plan.append(
+            (
+                re.compile(rf"\b(?:{alternatives})\b", flags),
+                tuple(index for index, _ in members),
+                literals if all(text.isascii() for text in literals) else (),
+                ignorecase,
+            )
+        )
+    return tuple(plan)
+
+
 def is_excluded_dir(dirname: str, extra_excludes: Sequence[str]) -> bool:
     if dirname in DEFAULT_EXCLUDES:
         return True
@@ -257,21 +452,20 @@ def is_excluded_dir(dirname: str, extra_excludes: Sequence[str]) -> bool:
 
 
 def infer_severity(path: Path) -> str:
-    ext = path.suffix.lower()
-    if ext in SEVERITY_BY_EXT["high"]:
-        return "high"
-    if ext in SEVERITY_BY_EXT["medium"]:
-        return "medium"
-    if ext in SEVERITY_BY_EXT["low"]:
-        return "low"
-    return "medium"
+    return _EXT_TO_SEV.get(path.suffix.lower(), "medium")
 
 
 def read_text(path: Path) -> str:
+    """Read ``path`` once as UTF-8 with universal newlines, dropping bad bytes."""
+
+    data = path.read_bytes()
     try:
-        return path.read_text(encoding="utf-8")
+        text = data.decode("utf-8")
     except UnicodeDecodeError:
-        return path.read_text(encoding="utf-8", errors="ignore")
+        text = data.decode("utf-8", errors="ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 def gather_context(lines: List[str], start: int, end: int, context: int) -> str:
@@ -281,51 +475,122 @@ def gather_context(lines: List[str], start: int, end: int, context: int) -> str:
     return "\n".join(snippet_lines).rstrip()
 
 
+def _line_starts(text: str) -> List[int]:
+    """Offsets where each line starts; ``bisect_right`` on them is a line number."""
+
+    starts = [0]
+    find = text.find
+    position = find("\n")
+    while position != -1:
+        position += 1
+        starts.append(position)
+        position = find("\n", position)
+    return starts
+
+
+@dataclass(frozen=True)
+class FileView:
+    """Text of one scanned file and the per-line views its detectors share.
+
+    Each view is built on first use and then reused, so a file is split into
+    lines and stripped once however many detectors look at it.
+    """
+
+    text: str
+
+    @cached_property
+    def lines(self) -> List[str]:
+        return self.text.splitlines()
+
+    @cached_property
+    def line_starts(self) -> List[int]:
+        return _line_starts(self.text)
+
+    @cached_property
+    def stripped_lines(self) -> List[str]:
+        return [line.strip() for line in self.lines]
+
+
 def detect_patterns(
     path: Path,
     display_path: str,
-    text: str,
+    view: FileView,
     patterns: Sequence[Pattern],
     context: int,
 ) -> List[Finding]:
     findings: List[Finding] = []
-    lines = text.splitlines()
-    for pattern in patterns:
-        for match in pattern.compiled.finditer(text):
-            start_line = text.count("\n", 0, match.start()) + 1
-            end_line = start_line + match.group(0).count("\n")
-            snippet = gather_context(lines, start_line, end_line, context)
-            findings.append(
-                Finding(
-                    tag=pattern.tag,
-                    kind=pattern.kind,
-                    file=display_path,
-                    line_start=start_line,
-                    line_end=end_line,
-                    snippet=snippet,
-                    description=pattern.description,
-                    severity=infer_severity(path),
-                    suggested_fix=pattern.suggested_fix,
-                )
+    text = view.text
+    pattern_tuple = tuple(patterns)
+    matches: List[Tuple[int, re.Match]] = []
+    lowered: Optional[str] = None
+    for regex, indices, literals, ignorecase in scan_plan(pattern_tuple):
+        if literals:
+            if ignorecase:
+                if lowered is None:
+                    lowered = lower_for_literals(text)
+                haystack = lowered
+            else:
+                haystack = text
+            if not any(literal in haystack for literal in literals):
+                continue
+        if len(indices) == 1:
+            matches.extend((indices[0], match) for match in regex.finditer(text))
+        else:
+            matches.extend(
+                (int(match.lastgroup[1:]), match) for match in regex.finditer(text)
+            )
+    if not matches:
+        return findings
+    # Report pattern by pattern, each in text order, as separate scans would.
+    matches.sort(key=itemgetter(0))
+    lines = view.lines
+    starts = view.line_starts
+    severity = infer_severity(path)
+    for index, match in matches:
+        pattern = pattern_tuple[index]
+        start_line = bisect.bisect_right(starts, match.start())
+        end_line = start_line + match.group(0).count("\n")
+        snippet = gather_context(lines, start_line, end_line, context)
+        findings.append(
+            Finding(
+                tag=pattern.tag,
+                kind=pattern.kind,
+                file=display_path,
+                line_start=start_line,
+                line_end=end_line,
+                snippet=snippet,
+                description=pattern.description,
+                severity=severity,
+                suggested_fix=pattern.suggested_fix,
             )
+        )
     return findings
 
 
+# Line that opens a function or class body in detect_python_stubs.
+_DEF_RE = re.compile(r"^\s*(?:def|async\s+def|class)\b")
+
+# Any of these in a comment block makes it look like commented-out code.
+_CODE_RE = re.compile(r"\bdef\b|\bclass\b|\bimport\b|\breturn\b|=|\(.*\)")
+
+
 def detect_python_stubs(
-    path: Path, display_path: str, text: str, context: int
+    path: Path, display_path: str, view: FileView, context: int
 ) -> List[Finding]:
-    lines = text.splitlines()
+    lines = view.lines
     findings: List[Finding] = []
     stack: List[int] = []
-    for idx, raw_line in enumerate(lines):
-        line = raw_line.rstrip("\n")
-        stripped = line.strip()
+    for idx, (line, stripped) in enumerate(
+        zip(lines, view.stripped_lines, strict=True)
+    ):
         if not stripped:
             continue
         indent = len(line) - len(line.lstrip(" \t"))
-        while stack and indent <= stack[-1]:
-            stack.pop()
-        if re.match(r"^\s*(def|async\s+def|class)\b", line):
+        # The stack of open indents is strictly increasing, so every level
+        # the line closes sits at or after bisect_left and goes in one slice.
+        if stack and indent <= stack[-1]:
+            del stack[bisect.bisect_left(stack, indent) :]
+        if _DEF_RE.match(line):
             stack.append(indent)
             continue
         if stripped == "pass" and stack:
@@ -364,86 +629,67 @@ def detect_python_stubs(
 
 
 def looks_like_code(line: str) -> bool:
-    patterns = [r"\bdef\b", r"\bclass\b", r"\bimport\b", r"\breturn\b", r"=", r"\(.*\)"]
-    return any(re.search(p, line) for p in patterns)
+    return _CODE_RE.search(line) is not None
 
 
 def detect_commented_code(
-    path: Path, display_path: str, text: str, context: int
+    path: Path, display_path: str, view: FileView, context: int
 ) -> List[Finding]:
     findings: List[Finding] = []
-    lines = text.splitlines()
-    idx = 0
-    while idx < len(lines):
-        line = lines[idx]
-        stripped = line.lstrip()
-        prefix = None
+    lines = view.lines
+    stripped_lines = view.stripped_lines
+
+    def flush(start_idx: int, end_line: int) -> None:
+        # A block is lines[start_idx:end_line]; end_line is 1-based inclusive.
+        if end_line - start_idx < 5:
+            return
+        if not looks_like_code("\n".join(lines[start_idx:end_line])):
+            return
+        start_line = start_idx + 1
+        snippet = gather_context(lines, start_line, end_line, context)
+        findings.append(
+            Finding(
+                tag="COMMENTED_CODE",
+                kind="commented_code",
+                file=display_path,
+                line_start=start_line,
+                line_end=end_line,
+                snippet=snippet,
+                description="Large block of commented-out code detected.",
+                severity=infer_severity(path),
+                suggested_fix="Remove the commented code or explain why it must remain.",
+            )
+        )
+
+    # One pass over the lines: ``prefix`` is the comment marker of the open
+    # "#" or "//" block, ``html_start`` the first line of an open <!-- block.
+    prefix: Optional[str] = None
+    block_start = 0
+    html_start: Optional[int] = None
+    for idx, line in enumerate(lines):
+        if html_start is not None:
+            if "-->" in line:
+                flush(html_start, idx + 1)
+                html_start = None
+            continue
+        # strip() keeps the same prefix as lstrip(), and "-->" holds no
+        # whitespace for the trailing strip to remove.
+        stripped = stripped_lines[idx]
+        if prefix is not None:
+            if stripped.startswith(prefix):
+                continue
+            flush(block_start, idx)
+            prefix = None
         if stripped.startswith("#"):
-            prefix = "#"
+            prefix, block_start = "#", idx
         elif stripped.startswith("//"):
-            prefix = "//"
+            prefix, block_start = "//", idx
         elif stripped.startswith("<!--") and "-->" not in stripped:
-            # handle multiline HTML comments
-            start_idx = idx
-            comment_block = [lines[idx]]
-            idx += 1
-            while idx < len(lines) and "-->" not in lines[idx]:
-                comment_block.append(lines[idx])
-                idx += 1
-            if idx < len(lines):
-                comment_block.append(lines[idx])
-            if len(comment_block) >= 5:
-                content = "\n".join(comment_block)
-                if looks_like_code(content):
-                    start_line = start_idx + 1
-                    end_line = idx + 1 if idx < len(lines) else len(lines)
-                    snippet = gather_context(lines, start_line, end_line, context)
-                    findings.append(
-                        Finding(
-                            tag="COMMENTED_CODE",
-                            kind="commented_code",
-                            file=display_path,
-                            line_start=start_line,
-                            line_end=end_line,
-                            snippet=snippet,
-                            description="Large block of commented-out code detected.",
-                            severity=infer_severity(path),
-                            suggested_fix="Remove the commented code or explain why it must remain.",
-                        )
-                    )
-            idx += 1
-            continue
-        if not prefix:
-            idx += 1
-            continue
-        start_idx = idx
-        block_lines = []
-        while idx < len(lines):
-            current = lines[idx].lstrip()
-            if current.startswith(prefix):
-                block_lines.append(lines[idx])
-                idx += 1
-            else:
-                break
-        if len(block_lines) >= 5:
-            content = "\n".join(block_lines)
-            if looks_like_code(content):
-                start_line = start_idx + 1
-                end_line = start_idx + len(block_lines)
-                snippet = gather_context(lines, start_line, end_line, context)
-                findings.append(
-                    Finding(
-                        tag="COMMENTED_CODE",
-                        kind="commented_code",
-                        file=display_path,
-                        line_start=start_line,
-                        line_end=end_line,
-                        snippet=snippet,
-                        description="Large block of commented-out code detected.",
-                        severity=infer_severity(path),
-                        suggested_fix="Remove the commented code or explain why it must remain.",
-                    )
-                )
+            html_start = idx
+    if html_start is not None:
+        flush(html_start, len(lines))
+    elif prefix is not None:
+        flush(block_start, len(lines))
     return findings
 
 
@@ -466,91 +712,419 @@ def unique_findings(findings: Iterable[Finding]) -> List[Finding]:
     return unique
 
 
+def iter_source_files(
+    root: Path, include_ext: frozenset, exclude_dirs: Sequence[str]
+) -> Iterator[Tuple[str, str, str]]:
+    """Yield ``(path, relative_posix_path, extension)`` for files below ``root``.
+
+    Excluded directories are pruned before descending, and ``os.scandir``
+    entries answer ``is_dir``/``is_file`` from the directory listing itself.
+    The relative path is built from directory names on the way down, so no
+    ``Path`` objects are created per file.
+    """
+
+    stack = [(os.fspath(root), "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            iterator = os.scandir(directory)
+        except OSError:
+            continue
+        with iterator as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not is_excluded_dir(entry.name, exclude_dirs):
+                        stack.append((entry.path, f"{prefix}{entry.name}/"))
+                    continue
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext in include_ext and entry.is_file():
+                    yield entry.path, prefix + entry.name, ext
+
+
+def scan_file(
+    path: Path,
+    display_path: str,
+    ext: str,
+    patterns: Sequence[Pattern],
+    context: int,
+) -> List[Finding]:
+    view = FileView(read_text(path))
+    file_findings = detect_patterns(path, display_path, view, patterns, context)
+    if ext == ".py":
+        file_findings.extend(detect_python_stubs(path, display_path, view, context))
+    file_findings.extend(detect_commented_code(path, display_path, view, context))
+    return file_findings
+
+
+def _scan_signature(patterns: Sequence[Pattern], context: int) -> str:
+    payload = json.dumps(
+        [
+            [p.tag, p.kind, p.regex, list(p.flags), p.description, p.suggested_fix]
+            for p in patterns
+        ]
+        + [context],
+        ensure_ascii=False,
+    )
+    return blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _open_scan_cache(cache_path: Path) -> sqlite3.Connection:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(cache_path)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS scan_cache ("
+        "path TEXT PRIMARY KEY, signature TEXT, mtime_ns INTEGER, "
+        "size INTEGER, findings TEXT)"
+    )
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS blame_cache ("
+        "path TEXT, head TEXT, blob TEXT, line INTEGER, author TEXT, "
+        "author_time TEXT, used INTEGER, PRIMARY KEY (path, head, blob, line))"
+    )
+    return connection
+
+
 def scan_repository(
     root: Path,
     patterns: Sequence[Pattern],
     include_ext: Sequence[str],
     exclude_dirs: Sequence[str],
     context: int,
+    cache_path: Optional[Path] = None,
 ) -> List[Finding]:
-    findings: List[Finding] = []
-    include_ext_lower = {ext.lower() for ext in include_ext}
-    for dirpath, dirnames, filenames in os.walk(root):
-        dirnames[:] = [d for d in dirnames if not is_excluded_dir(d, exclude_dirs)]
-        for filename in filenames:
-            path = Path(dirpath) / filename
-            ext = path.suffix.lower()
-            if ext not in include_ext_lower:
-                continue
-            text = read_text(path)
-            try:
-                rel_path = path.relative_to(root)
-            except ValueError:
-                rel_path = path
-            display_path = rel_path.as_posix()
-            file_findings = []
-            file_findings.extend(
-                detect_patterns(path, display_path, text, patterns, context)
-            )
-            if ext == ".py":
-                file_findings.extend(
-                    detect_python_stubs(path, display_path, text, context)
+    """Scan ``root`` for placeholder findings.
+
+    When ``cache_path`` is given, per-file findings are stored in an SQLite
+    database keyed by path, size, mtime and a signature of the patterns and
+    context; unchanged files are served from it without being re-read.
+    The remaining files are scanned in worker processes when there are
+    enough of them and more than one CPU.
+    """
+
+    include_ext_lower = frozenset(ext.lower() for ext in include_ext)
+    cache = _open_scan_cache(cache_path) if cache_path is not None else None
+    signature = _scan_signature(patterns, context) if cache is not None else ""
+    per_file: List[Optional[List[Finding]]] = []
+    pending: List[Tuple[int, Path, str, str]] = []
+    cache_rows: Dict[int, Tuple[str, int, int]] = {}
+    try:
+        for file_path, display_path, ext in iter_source_files(
+            root, include_ext_lower, exclude_dirs
+        ):
+            path = Path(file_path)
+            slot = len(per_file)
+            per_file.append(None)
+            if cache is not None:
+                cache_key = os.path.abspath(file_path)
+                stat = os.stat(file_path)
+                row = cache.execute(
+                    "SELECT findings FROM scan_cache "
+                    "WHERE path = ? AND signature = ? AND mtime_ns = ? AND size = ?",
+                    (cache_key, signature, stat.st_mtime_ns, stat.st_size),
+                ).fetchone()
+                if row is not None:
+                    per_file[slot] = [Finding(**entry) for entry in json.loads(row[0])]
+                    continue
+                cache_rows[slot] = (cache_key, stat.st_mtime_ns, stat.st_size)
+            pending.append((slot, path, display_path, ext))
+        if len(pending) > _PARALLEL_SCAN_MIN_FILES and (os.cpu_count() or 1) > 1:
+            # Files are independent; a pool only pays off once its start-up
+            # cost is spread over enough of them. map() keeps the input order.
+            with ProcessPoolExecutor() as executor:
+                results = executor.map(
+                    scan_file,
+                    [path for _, path, _, _ in pending],
+                    [display_path for _, _, display_path, _ in pending],
+                    [ext for _, _, _, ext in pending],
+                    repeat(patterns),
+                    repeat(context),
+                    chunksize=16,
                 )
-            file_findings.extend(
-                detect_commented_code(path, display_path, text, context)
-            )
-            findings.extend(file_findings)
+                for (slot, _, _, _), file_findings in zip(
+                    pending, results, strict=True
+                ):
+                    per_file[slot] = file_findings
+        else:
+            for slot, path, display_path, ext in pending:
+                per_file[slot] = scan_file(path, display_path, ext, patterns, context)
+        # The SQLite cache stays in this process; workers only return findings.
+        if cache is not None:
+            for slot, (cache_key, mtime_ns, size) in cache_rows.items():
+                cache.execute(
+                    "INSERT OR REPLACE INTO scan_cache VALUES (?, ?, ?, ?, ?)",
+                    (
+                        cache_key,
+                        signature,
+                        mtime_ns,
+                        size,
+                        json.dumps([f.to_dict() for f in per_file[slot]]),
+                    ),
+                )
+    finally:
+        if cache is not None:
+            cache.commit()
+            cache.close()
+    findings = [finding for file_findings in per_file for finding in file_findings]
     findings = unique_findings(findings)
     findings.sort(key=lambda f: (f.file, f.line_start, f.tag))
     return findings
 
 
-def apply_git_blame(root: Path, findings: List[Finding]) -> None:
-    for finding in findings:
+# Author git blame reports for lines that only exist in the working tree.
+_UNCOMMITTED_AUTHOR = "Not Committed Yet"
+
+# Least recently used blame_cache rows beyond this many are dropped.
+_BLAME_CACHE_MAX_ROWS = 10_000
+
+_PORCELAIN_HEADER = re.compile(r"^([0-9a-f]{40,64}) \d+ (\d+)(?: \d+)?$")
+
+
+def _blame_date(author_time: str, author_tz: str) -> str:
+    """Render a porcelain author time as ``git blame``'s default date."""
+
+    try:
+        timestamp = int(author_time)
+        sign = -1 if author_tz.startswith("-") else 1
+        hours, minutes = int(author_tz[1:3]), int(author_tz[3:5])
+    except ValueError:
+        return ""
+    offset = dt.timezone(sign * dt.timedelta(hours=hours, minutes=minutes))
+    return dt.datetime.fromtimestamp(timestamp, offset).strftime("%Y-%m-%d")
+
+
+def blame_lines(
+    root: Path, file: str, line_numbers: Sequence[int]
+) -> Optional[Dict[int, Tuple[str, str]]]:
+    """Return ``{line: (author, date)}`` from one porcelain blame of ``file``.
+
+    Every line is passed as its own ``-L`` range so a single ``git blame``
+    covers all findings of the file. Returns ``None`` when git fails.
+    """
+
+    blame_args = ["git", "blame", "--porcelain"]
+    for line_number in line_numbers:
+        blame_args += ["-L", f"{line_number},{line_number}"]
+    blame_args += ["--", file]
+    try:
+        result = subprocess.run(
+            blame_args,
+            cwd=root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=False,
+            text=True,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    # Porcelain prints a commit's metadata only the first time it appears.
+    metadata: Dict[str, Dict[str, str]] = defaultdict(dict)
+    line_commits: Dict[int, str] = {}
+    commit = ""
+    expect_header = True
+    for line in result.stdout.splitlines():
+        if expect_header:
+            header = _PORCELAIN_HEADER.match(line)
+            if header:
+                commit = header.group(1)
+                line_commits[int(header.group(2))] = commit
+                expect_header = False
+            continue
+        if line.startswith("\t"):
+            expect_header = True
+            continue
+        key, _, value = line.partition(" ")
+        if key in {"author", "author-time", "author-tz"}:
+            metadata[commit][key] = value
+    authors: Dict[int, Tuple[str, str]] = {}
+    for line_number, commit in line_commits.items():
+        info = metadata[commit]
+        authors[line_number] = (
+            info.get("author", "").strip(),
+            _blame_date(info.get("author-time", ""), info.get("author-tz", "+0000")),
+        )
+    return authors
+
+
+def head_commit(root: Path) -> Optional[str]:
+    """Return the commit id ``HEAD`` points at, or ``None`` without one."""
+
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", "HEAD"],
+            cwd=root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=False,
+            text=True,
+        )
+    except OSError:
+        return None
+    head = result.stdout.strip()
+    if result.returncode != 0 or not head:
+        return None
+    return head
+
+
+def blob_oids(root: Path, files: Sequence[str]) -> Dict[str, str]:
+    """Return the git blob id of each file's current content, from one call."""
+
+    # --stdin-paths is line based, so names containing a newline are skipped.
+    names = [file for file in files if "\n" not in file]
+    if not names:
+        return {}
+    try:
+        result = subprocess.run(
+            ["git", "hash-object", "--stdin-paths"],
+            cwd=root,
+            input="".join(f"{name}\n" for name in names),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=False,
+            text=True,
+        )
+    except OSError:
+        return {}
+    oids = result.stdout.split()
+    if result.returncode != 0 or len(oids) != len(names):
+        return {}
+    return dict(zip(names, oids, strict=True))
+
+
+def apply_git_blame(
+    root: Path, findings: List[Finding], cache_path: Optional[Path] = None
+) -> None:
+    """Fill author metadata in place, replacing each frozen finding in the list.
+
+    Findings are grouped by file so each file is blamed once, and the files
+    are blamed concurrently since the work happens in git subprocesses.
+    When ``cache_path`` is given, blamed lines are also stored in its SQLite
+    database keyed by path, ``HEAD`` commit, blob id of the file content and
+    line, so later runs on the same commit only blame files whose content
+    changed. Any change of ``HEAD`` (new commit, rebase, amend, checkout)
+    misses the cache, since it can change who a line is attributed to.
+    """
+
+    pending: Dict[str, List[int]] = defaultdict(list)
+    for index, finding in enumerate(findings):
         key = (Path(finding.file), finding.line_start, finding.line_end)
         if key in GIT_BLAME_CACHE:
             author, author_time = GIT_BLAME_CACHE[key]
-            finding.author = author
-            finding.author_time = author_time
+            findings[index] = replace(finding, author=author, author_time=author_time)
             continue
-        rel_path = Path(finding.file)
-        blame_args = [
-            "git",
-            "blame",
-            "-L",
-            f"{finding.line_start},{finding.line_end}",
-            "--",
-            str(rel_path),
-        ]
-        try:
-            result = subprocess.run(
-                blame_args,
-                cwd=root,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=False,
-                text=True,
+        pending[finding.file].append(index)
+    if not pending:
+        return
+
+    head = head_commit(root) if cache_path is not None else None
+    cache = _open_scan_cache(cache_path) if head is not None else None
+    try:
+        blobs = blob_oids(root, list(pending)) if cache is not None else {}
+        stamp = time.time_ns()
+        if cache is not None:
+            _apply_cached_blame(cache, head, blobs, stamp, findings, pending)
+        blamed_rows = _blame_pending(root, findings, pending)
+        if cache is not None:
+            cache.executemany(
+                "INSERT OR REPLACE INTO blame_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (file, head, blobs[file], line, author, author_time, stamp)
+                    for file, line, author, author_time in blamed_rows
+                    if file in blobs and author != _UNCOMMITTED_AUTHOR
+                ),
             )
-        except OSError:
-            continue
-        if result.returncode != 0:
+            cache.execute(
+                "DELETE FROM blame_cache WHERE rowid IN (SELECT rowid FROM "
+                "blame_cache ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                (_BLAME_CACHE_MAX_ROWS,),
+            )
+    finally:
+        if cache is not None:
+            cache.commit()
+            cache.close()
+
+
+def _apply_cached_blame(
+    cache: sqlite3.Connection,
+    head: str,
+    blobs: Dict[str, str],
+    stamp: int,
+    findings: List[Finding],
+    pending: Dict[str, List[int]],
+) -> None:
+    """Serve ``pending`` findings from the blame cache, dropping those it covers."""
+
+    for file in list(pending):
+        blob = blobs.get(file)
+        if blob is None:
             continue
-        lines = result.stdout.splitlines()
-        if not lines:
+        rows = {
+            line: (author, author_time)
+            for line, author, author_time in cache.execute(
+                "SELECT line, author, author_time FROM blame_cache "
+                "WHERE path = ? AND head = ? AND blob = ?",
+                (file, head, blob),
+            )
+        }
+        if not rows:
             continue
-        first_line = lines[0]
-        match = re.search(
-            r"\((?P<author>.+?)\s+(?P<date>\d{4}-\d{2}-\d{2})", first_line
+        cache.execute(
+            "UPDATE blame_cache SET used = ? "
+            "WHERE path = ? AND head = ? AND blob = ?",
+            (stamp, file, head, blob),
         )
-        if match:
-            author = match.group("author").strip()
-            author_time = match.group("date")
+        remaining = []
+        for index in pending[file]:
+            finding = findings[index]
+            if finding.line_start not in rows:
+                remaining.append(index)
+                continue
+            author, author_time = rows[finding.line_start]
+            findings[index] = replace(finding, author=author, author_time=author_time)
+            key = (Path(finding.file), finding.line_start, finding.line_end)
+            GIT_BLAME_CACHE[key] = (author, author_time)
+        if remaining:
+            pending[file] = remaining
         else:
-            author = ""
-            author_time = ""
-        finding.author = author
-        finding.author_time = author_time
-        GIT_BLAME_CACHE[key] = (author, author_time)
+            del pending[file]
+
+
+def _blame_pending(
+    root: Path, findings: List[Finding], pending: Dict[str, List[int]]
+) -> List[Tuple[str, int, str, str]]:
+    """Blame the ``pending`` findings; return ``(file, line, author, date)`` rows."""
+
+    def blame_file(file: str) -> Dict[int, Tuple[str, str]]:
+        line_numbers = sorted({findings[index].line_start for index in pending[file]})
+        authors = blame_lines(root, str(Path(file)), line_numbers)
+        if authors is not None:
+            return authors
+        # One out-of-range line fails the whole call; retry lines one by one
+        # so the others still get their author.
+        authors = {}
+        if len(line_numbers) > 1:
+            for line_number in line_numbers:
+                authors.update(blame_lines(root, str(Path(file)), [line_number]) or {})
+        return authors
+
+    if not pending:
+        return []
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        blamed = dict(zip(pending, executor.map(blame_file, pending), strict=True))
+    rows: List[Tuple[str, int, str, str]] = []
+    for file, indices in pending.items():
+        authors = blamed[file]
+        rows.extend((file, line, *author) for line, author in authors.items())
+        for index in indices:
+            finding = findings[index]
+            if finding.line_start not in authors:
+                continue
+            author, author_time = authors[finding.line_start]
+            findings[index] = replace(finding, author=author, author_time=author_time)
+            key = (Path(finding.file), finding.line_start, finding.line_end)
+            GIT_BLAME_CACHE[key] = (author, author_time)
+    return rows
 
 
 def write_csv(path: Path, findings: Sequence[Finding]) -> None:
@@ -572,28 +1146,38 @@ def write_csv(path: Path, findings: Sequence[Finding]) -> None:
                 "author_time",
             ]
         )
-        for finding in findings:
-            writer.writerow(
-                [
-                    finding.tag,
-                    finding.kind,
-                    finding.file,
-                    finding.line_start,
-                    finding.line_end,
-                    finding.snippet,
-                    finding.description,
-                    finding.severity,
-                    finding.suggested_fix,
-                    finding.author,
-                    finding.author_time,
-                ]
+        writer.writerows(
+            (
+                finding.tag,
+                finding.kind,
+                finding.file,
+                finding.line_start,
+                finding.line_end,
+                finding.snippet,
+                finding.description,
+                finding.severity,
+                finding.suggested_fix,
+                finding.author,
+                finding.author_time,
             )
+            for finding in findings
+        )
+
+
+def _findings_json(findings: Sequence[Finding]) -> bytes:
+    """Serialize ``findings`` as indented UTF-8 JSON, via orjson when installed."""
+
+    if _orjson is not None:
+        # orjson encodes the dataclasses directly, in field order like to_dict().
+        return _orjson.dumps(list(findings), option=_orjson.OPT_INDENT_2)
+    return json.dumps(
+        [f.to_dict() for f in findings], indent=2, ensure_ascii=False
+    ).encode("utf-8")
 
 
 def write_json(path: Path, findings: Sequence[Finding]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump([f.to_dict() for f in findings], handle, indent=2, ensure_ascii=False)
+    path.write_bytes(_findings_json(findings))
 
 
 def summarize(findings: Sequence[Finding]) -> Dict[str, Counter]:
@@ -618,13 +1202,17 @@ def load_baseline(path: Path) -> List[Dict[str, str]]:
     return data if isinstance(data, list) else []
 
 
-def _fingerprint_key(tag: str, kind: str, file_path: str, snippet: str) -> str:
-    snippet_hash = sha256(snippet.encode("utf-8")).hexdigest()
-    return "|".join([tag, kind, file_path, snippet_hash])
+Fingerprint = Tuple[str, str, str, str]
+
+
+def _fingerprint_key(tag: str, kind: str, file_path: str, snippet: str) -> Fingerprint:
+    # Both sides are fingerprinted in-process, so the fields themselves make
+    # the key; str hashes are cached, and no separator can make keys collide.
+    return (tag, kind, file_path, snippet)
 
 
-def findings_to_fingerprint(findings: Sequence[Finding]) -> Dict[str, Finding]:
-    mapping: Dict[str, Finding] = {}
+def findings_to_fingerprint(findings: Sequence[Finding]) -> Dict[Fingerprint, Finding]:
+    mapping: Dict[Fingerprint, Finding] = {}
     for finding in findings:
         fingerprint = _fingerprint_key(
             finding.tag,
@@ -638,8 +1226,8 @@ def findings_to_fingerprint(findings: Sequence[Finding]) -> Dict[str, Finding]:
 
 def baseline_fingerprint(
     entries: Sequence[Dict[str, str]],
-) -> Dict[str, Dict[str, str]]:
-    mapping: Dict[str, Dict[str, str]] = {}
+) -> Dict[Fingerprint, Dict[str, str]]:
+    mapping: Dict[Fingerprint, Dict[str, str]] = {}
     for entry in entries:
         fingerprint = _fingerprint_key(
             entry.get("tag", ""),
@@ -657,8 +1245,8 @@ def compare_to_baseline(
 ) -> Tuple[List[Finding], List[Dict[str, str]]]:
     current_fp = findings_to_fingerprint(findings)
     baseline_fp = baseline_fingerprint(baseline_entries)
-    new = [current_fp[key] for key in current_fp.keys() - baseline_fp.keys()]
-    resolved = [baseline_fp[key] for key in baseline_fp.keys() - current_fp.keys()]
+    new = [finding for key, finding in current_fp.items() if key not in baseline_fp]
+    resolved = [entry for key, entry in baseline_fp.items() if key not in current_fp]
     return new, resolved
 
 
@@ -671,83 +1259,61 @@ def write_markdown(
 ) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     summary = summarize(findings)
-    lines = ["# Placeholder Audit", ""]
-    lines.append("## Summary")
-    lines.append("")
-    lines.append("### Counts by tag")
-    lines.append("")
-    lines.append("| Tag | Count |")
-    lines.append("| --- | ---: |")
-    for tag, count in summary["tags"].most_common():
-        lines.append(f"| {tag} | {count} |")
-    if not summary["tags"]:
-        lines.append("| *(none)* | 0 |")
-    lines.append("")
-    lines.append("### Counts by directory")
-    lines.append("")
-    lines.append("| Directory | Count |")
-    lines.append("| --- | ---: |")
-    for directory, count in summary["dirs"].most_common():
-        lines.append(f"| {directory} | {count} |")
-    if not summary["dirs"]:
-        lines.append("| *(none)* | 0 |")
-    lines.append("")
-    lines.append("### Top files")
-    lines.append("")
-    lines.append("| File | Count |")
-    lines.append("| --- | ---: |")
-    for file, count in summary["files"].most_common(10):
-        lines.append(f"| {file} | {count} |")
-    if not summary["files"]:
-        lines.append("| *(none)* | 0 |")
-    lines.append("")
-    lines.append("## New vs Baseline")
-    lines.append("")
-    lines.append("| Status | Count |")
-    lines.append("| --- | ---: |")
-    lines.append(f"| New | {len(new)} |")
-    lines.append(f"| Resolved | {len(resolved)} |")
-    unchanged = max(len(findings) - len(new), 0)
-    lines.append(f"| Remaining | {unchanged} |")
-    lines.append("")
-    if new:
-        lines.append("### New findings")
-        lines.append("")
-        for finding in new:
-            lines.append(
-                f"- `{finding.file}:{finding.line_start}` **{finding.tag}** – {finding.description or finding.snippet.splitlines()[0]}"
-            )
-        lines.append("")
-    if resolved:
-        lines.append("### Resolved findings")
-        lines.append("")
-        for entry in resolved:
-            file = entry.get("file", "")
-            line = entry.get("line_start", "")
-            tag = entry.get("tag", "")
-            description = entry.get("description", entry.get("snippet", ""))
-            lines.append(f"- `{file}:{line}` **{tag}** – {description}")
-        lines.append("")
-    lines.append("## Appendix")
-    lines.append("")
     files_group: Dict[str, List[Finding]] = defaultdict(list)
     for finding in findings:
         files_group[finding.file].append(finding)
-    for file in sorted(files_group.keys()):
-        lines.append(f"### {file}")
-        lines.append("")
-        lines.append(
-            "| Line(s) | Tag | Kind | Severity | Description | Suggested fix | Snippet |"
-        )
-        lines.append("| --- | --- | --- | --- | --- | --- | --- |")
-        for finding in files_group[file]:
-            snippet = finding.snippet.replace("\n", "<br />")
-            lines.append(
-                f"| {finding.line_start}-{finding.line_end} | {finding.tag} | {finding.kind} | {finding.severity} | {finding.description} | {finding.suggested_fix} | {snippet} |"
-            )
-        lines.append("")
+    # Sections are written to the handle as they are produced instead of
+    # being collected and joined; every line ends with "\n".
     with path.open("w", encoding="utf-8") as handle:
-        handle.write("\n".join(lines))
+        w = handle.write
+        w("# Placeholder Audit\n\n## Summary\n\n")
+        w("### Counts by tag\n\n| Tag | Count |\n| --- | ---: |\n")
+        for tag, count in summary["tags"].most_common():
+            w(f"| {tag} | {count} |\n")
+        if not summary["tags"]:
+            w("| *(none)* | 0 |\n")
+        w("\n### Counts by directory\n\n| Directory | Count |\n| --- | ---: |\n")
+        for directory, count in summary["dirs"].most_common():
+            w(f"| {directory} | {count} |\n")
+        if not summary["dirs"]:
+            w("| *(none)* | 0 |\n")
+        w("\n### Top files\n\n| File | Count |\n| --- | ---: |\n")
+        for file, count in summary["files"].most_common(10):
+            w(f"| {file} | {count} |\n")
+        if not summary["files"]:
+            w("| *(none)* | 0 |\n")
+        unchanged = max(len(findings) - len(new), 0)
+        w("\n## New vs Baseline\n\n| Status | Count |\n| --- | ---: |\n")
+        w(f"| New | {len(new)} |\n| Resolved | {len(resolved)} |\n")
+        w(f"| Remaining | {unchanged} |\n\n")
+        if new:
+            w("### New findings\n\n")
+            for finding in new:
+                w(
+                    f"- `{finding.file}:{finding.line_start}` **{finding.tag}** – {finding.description or finding.snippet.splitlines()[0]}\n"
+                )
+            w("\n")
+        if resolved:
+            w("### Resolved findings\n\n")
+            for entry in resolved:
+                file = entry.get("file", "")
+                line = entry.get("line_start", "")
+                tag = entry.get("tag", "")
+                description = entry.get("description", entry.get("snippet", ""))
+                w(f"- `{file}:{line}` **{tag}** – {description}\n")
+            w("\n")
+        w("## Appendix\n")
+        for file in sorted(files_group.keys()):
+            w(f"\n### {file}\n\n")
+            w(
+                "| Line(s) | Tag | Kind | Severity | Description | Suggested fix | Snippet |\n"
+            )
+            w("| --- | --- | --- | --- | --- | --- | --- |\n")
+            for finding in files_group[file]:
+                snippet = finding.snippet.replace("\n", "<br />")
+                w(
+                    f"| {finding.line_start}-{finding.line_end} | {finding.tag} | {finding.kind} | {finding.severity} | {finding.description} | {finding.suggested_fix} | {snippet} |\n"
+                )
 
 
 def save_baseline(path: Path, findings: Sequence[Finding]) -> None:
@@ -758,16 +1324,23 @@ def save_baseline(path: Path, findings: Sequence[Finding]) -> None:
 def run_scan(args: argparse.Namespace) -> int:
     root = Path(args.root).resolve()
     include_ext = args.include_ext or sorted(DEFAULT_EXTENSIONS)
-    patterns = load_patterns(Path(args.patterns))
+    pattern_path = Path(args.patterns)
+    if args.pattern_cache:
+        patterns = load_patterns_cached(pattern_path)
+    else:
+        patterns = load_patterns(pattern_path)
     findings = scan_repository(
         root=root,
         patterns=patterns,
         include_ext=include_ext,
         exclude_dirs=args.exclude_dir or [],
         context=args.context,
+        cache_path=Path(args.cache) if args.cache else None,
     )
     if args.blame:
-        apply_git_blame(root, findings)
+        apply_git_blame(
+            root, findings, cache_path=Path(args.cache) if args.cache else None
+        )
 
     baseline_path = Path(args.baseline)
     baseline_entries = load_baseline(baseline_path)
@@ -847,6 +1420,17 @@ def build_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--blame", action="store_true", help="Include git blame metadata"
     )
+    parser.add_argument(
+        "--cache",
+        help="SQLite file used to reuse findings and blame for unchanged files "
+        "between runs",
+    )
+    parser.add_argument(
+        "--pattern-cache",
+        action="store_true",
+        help="Reuse the parsed pattern file from $XDG_CACHE_HOME/scan_placeholders "
+        "while it is unchanged",
+    )
     parser.add_argument(
         "--max-new", type=int, help="Maximum allowed new findings before failing"
     )